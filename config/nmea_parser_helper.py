@@ -52,7 +52,7 @@ class NMEANavigationParser:
                     else:
                         # Convert knots to m/s for consistency with navigation system
                         speed_mps = NMEANavigationParser.convert_knots_to_mps(speed_knots)
-                        logger.debug(f"RMC: Parsed speed {speed_knots:.2f} kn → {speed_mps:.2f} m/s")
+                        logger.debug("RMC: Parsed speed %.2f kn → %.2f m/s", speed_knots, speed_mps)
                 except (ValueError, TypeError):
                     logger.debug(f"RMC: Invalid speed format: {rmc.spd}")
             
@@ -103,7 +103,7 @@ class NMEANavigationParser:
                     else:
                         # Convert knots to m/s for consistency with navigation system
                         speed_mps = NMEANavigationParser.convert_knots_to_mps(speed_knots)
-                        logger.debug(f"VTG: Parsed speed {speed_knots:.2f} kn → {speed_mps:.2f} m/s")
+                        logger.debug("VTG: Parsed speed %.2f kn → %.2f m/s", speed_knots, speed_mps)
                 except (ValueError, TypeError):
                     logger.debug(f"VTG: Invalid speed format: {vtg.sogk}")
             
@@ -1,11 +1,30 @@
 import time
+from typing import Optional
 
-def build_dummy_gga() -> str:
+# Fixed parts of the dummy GGA (e.g., center of Poland) - only the time field changes
+_DUMMY_GGA_PREFIX = b"$GNGGA,"
+_DUMMY_GGA_SUFFIX = b",5213.0000,N,02100.0000,E,1,08,1.0,100.0,M,0.0,M,,*00\r\n"
+
+def build_dummy_gga_bytes(timestamp: Optional[float] = None) -> bytes:
+    """
+    Builds the dummy GGA sentence directly as bytes, ready to send.
+    The time field is UTC, as NMEA requires.
+    """
+    t = time.gmtime(timestamp)
+    return b"%s%02d%02d%02d%s" % (_DUMMY_GGA_PREFIX, t.tm_hour, t.tm_min, t.tm_sec, _DUMMY_GGA_SUFFIX)
+
+
+def nmea_to_degrees(value: str, hemisphere: str = '') -> Optional[float]:
     """
-    Builds a standardized dummy GGA sentence for keep-alive or fallback.
-    Uses a fixed location (e.g., center of Poland) and current time.
+    Converts an NMEA ddmm.mmmm / dddmm.mmmm coordinate to decimal degrees.
+    Minutes are kept as a scaled integer and divided once, so the conversion
+    does not lose precision to intermediate float rounding.
+    Returns None for empty or malformed fields.
     """
-    current_time = time.strftime('%H%M%S')
-    # Using a consistent location for the dummy message
-    dummy_gga = f"$GNGGA,{current_time},5213.0000,N,02100.0000,E,1,08,1.0,100.0,M,0.0,M,,*00\r\n"
-    return dummy_gga
+    whole, _, frac = value.partition('.')
+    if len(whole) < 3 or not whole.isdigit() or (frac and not frac.isdigit()):
+        return None
+    scale = 10 ** len(frac)
+    minutes_scaled = int(whole[-2:]) * scale + (int(frac) if frac else 0)
+    degrees = int(whole[:-2]) + minutes_scaled / (60.0 * scale)
+    return -degrees if hemisphere in ('S', 'W') else degrees
@@ -85,7 +85,9 @@ rtk_config = {
     "mountpoint": os.getenv("ASG_MOUNTPOINT", "NEAR"),  # Auto-select nearest station
     "username": username,
     "password": password,
-    "enabled": bool(username and password)  # Flag to indicate if NTRIP is configured
+    "enabled": bool(username and password),  # Flag to indicate if NTRIP is configured
+    # False skips a whole claimed frame after a CRC failure - faster resync on noisy links
+    "strict_resync": os.getenv("RTCM_STRICT_RESYNC", "True").lower() == "true"
 }
 
 # UART configuration for LC29H(DA)
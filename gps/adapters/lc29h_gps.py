@@ -1,28 +1,135 @@
+import os
 import serial
+import select
 import time
 import logging
-import struct
-from typing import Optional
-from pynmeagps import NMEAReader, NMEAMessage
+from typing import Optional, List
+from pynmeagps import NMEAReader
 
 from config.nmea_parser_helper import NMEANavigationParser
+from config.nmea_utils import nmea_to_degrees
+from ..jit_nmea import parse_gga_bytes, GGA_MALFORMED, GGA_NO_POSITION
 from ..core.interfaces import GPS, Position, RTKStatus
 
 logger = logging.getLogger(__name__)
 
+BAUDRATE_CACHE_FILE = os.path.expanduser("~/.cache/rtkrover/baud")
+
+def _load_cached_baudrate() -> Optional[int]:
+    try:
+        with open(BAUDRATE_CACHE_FILE) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+def _save_cached_baudrate(baudrate: int):
+    try:
+        os.makedirs(os.path.dirname(BAUDRATE_CACHE_FILE), exist_ok=True)
+        tmp_path = f"{BAUDRATE_CACHE_FILE}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(str(baudrate))
+        os.replace(tmp_path, BAUDRATE_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not cache GPS baudrate: {e}")
+
+def _nmea_cmd(body: bytes) -> bytes:
+    """Frame an NMEA command body as $<body>*<checksum>\\r\\n"""
+    checksum = 0
+    for byte in body:
+        checksum ^= byte
+    return b'$' + body + b'*' + f'{checksum:02X}'.encode('ascii') + b'\r\n'
+
+# Configuration commands sequence: (command_bytes, description)
+LC29H_CONFIG_COMMANDS = (
+    (_nmea_cmd(b"PAIR062,0,1"), "Enable GGA 1Hz"),
+    (_nmea_cmd(b"PAIR062,1,0"), "Disable GLL"),
+    (_nmea_cmd(b"PAIR062,2,0"), "Disable GSA"),
+    (_nmea_cmd(b"PAIR062,3,0"), "Disable GSV"),
+    (_nmea_cmd(b"PAIR062,4,0"), "Disable RMC"),
+    (_nmea_cmd(b"PAIR062,5,1"), "Enable VTG"),
+)
+
+# Last baudrate that worked - tried first on the next connect
+_cached_baudrate = _load_cached_baudrate()
+
+class SerialLineReader:
+    """
+    Line reader over a serial port that drains all pending bytes per read.
+    
+    pyserial's readline() issues one read(1) syscall per byte, and wrapping the
+    port in io.BufferedReader would block until a full buffer arrives. This
+    waits for the first byte, then takes everything in_waiting in one call.
+    """
+    MAX_BUFFER = 4096
+    
+    def __init__(self, conn: serial.Serial):
+        self._conn = conn
+        self._buffer = bytearray()
+    
+    def readline(self) -> bytes:
+        while True:
+            end = self._buffer.find(b'\n')
+            if end >= 0:
+                line = bytes(self._buffer[:end + 1])
+                del self._buffer[:end + 1]
+                return line
+            
+            chunk = self._conn.read(self._conn.in_waiting or 1)
+            if not chunk:
+                return b''  # Timeout - keep the partial line for the next call
+            self._buffer += chunk
+            if len(self._buffer) > self.MAX_BUFFER:
+                # No line terminator in sight - resynchronise on the next sentence
+                self._buffer.clear()
+
 class LC29HGPS(GPS):
     BAUDRATES = [115200, 38400, 9600]
     
+    # Decoded GGA fields: (name, type, min, max, default, clamp)
+    # Empty fields take the default; out-of-range values are clamped,
+    # or reset to the default when clamping makes no sense
+    _GGA_FIELDS = (
+        ('altitude', float, -1000.0, 10000.0, 0.0, True),
+        ('satellite count', int, 0, 50, 0, True),
+        ('HDOP', float, 0.0, 50.0, 0.0, True),
+        ('quality indicator', int, 0, 9, 0, False),
+    )
+    
+    # Common NMEA messages - silently ignored
+    _SILENT_SENTENCES = frozenset((b'GSA', b'GSV', b'RMC'))
+    
+    # GGA quality indicator (0-9) -> RTK status
+    _QUALITY_TO_RTK = (
+        RTKStatus.NO_FIX,       # 0: No fix
+        RTKStatus.SINGLE,       # 1: GPS fix (SPS)
+        RTKStatus.DGPS,         # 2: DGPS fix
+        RTKStatus.SINGLE,       # 3: PPS fix (treat as single)
+        RTKStatus.RTK_FIXED,    # 4: RTK fixed
+        RTKStatus.RTK_FLOAT,    # 5: RTK float
+        RTKStatus.NO_FIX,       # 6: Estimated (dead reckoning)
+        RTKStatus.NO_FIX,       # 7: Manual input
+        RTKStatus.NO_FIX,       # 8: Simulation
+        RTKStatus.NO_FIX,       # 9: WAAS/SBAS
+    )
+    
+    # Most lines read_position() consumes per call - a full epoch with GSV is ~20
+    _MAX_LINES_PER_READ = 32
+    
+    # (epoch second, formatted UTC timestamp) - fixes arrive several times per second
+    _ts_cache = (0, '')
+    
     def __init__(self, port: str):
         self.port = port
         self.serial_conn: Optional[serial.Serial] = None
-        self.nmea_reader: Optional[NMEAReader] = None
+        self.line_reader: Optional[SerialLineReader] = None
         self._last_gga_time = 0
         
         self._last_position_log = 0
         self._last_rtcm_log = 0
         self._position_log_interval = 10.0  
         self._rtcm_log_interval = 5.0      
+        self._last_exc_log = 0
+        self._exc_log_interval = 10.0
         self._rtcm_message_count = 0
         self._last_rtk_status = None
         self.last_heading = None
@@ -30,39 +137,77 @@ class LC29HGPS(GPS):
         self._last_rmc_time = 0
         self._last_vtg_time = 0
         
+        # Sentence type (bytes 3-5 of the raw line) -> handler
+        self._dispatch = {b'GGA': self._handle_gga, b'VTG': self._handle_vtg}
+        
     def connect(self) -> bool:
+        global _cached_baudrate
         logger.info(f"🔌 Connecting to LC29H GPS on {self.port}")
-        for baudrate in self.BAUDRATES:
+        baudrates = list(self.BAUDRATES)
+        if _cached_baudrate in baudrates:
+            baudrates.remove(_cached_baudrate)
+            baudrates.insert(0, _cached_baudrate)
+        
+        # Open the port once and only retune the baudrate per probe - reopening
+        # the tty each time is slower and can pulse DTR on USB-UART bridges
+        try:
+            probe_serial = serial.Serial(port=self.port, baudrate=baudrates[0], timeout=2.0)
+        except Exception as e:
+            logger.error(f"❌ Failed to open GPS port {self.port}: {e}")
+            return False
+        self._enable_low_latency(probe_serial)
+        
+        for baudrate in baudrates:
             logger.debug(f"🔌 Trying connection at {baudrate} baud...")
-            if self._try_connect(baudrate):
+            if self._try_connect(probe_serial, baudrate):
+                if baudrate != _cached_baudrate:
+                    _cached_baudrate = baudrate
+                    _save_cached_baudrate(baudrate)
                 self._configure_lc29h()
                 return True
+        probe_serial.close()
         logger.error(f"❌ Failed to connect to GPS on {self.port}")
         return False
     
-    def _try_connect(self, baudrate: int) -> bool:
+    def _enable_low_latency(self, conn: serial.Serial):
+        # USB-UART bridges (FTDI) otherwise batch input for up to 16 ms before
+        # handing it over; sets ASYNC_LOW_LATENCY via TIOCSSERIAL on Linux
+        try:
+            conn.set_low_latency_mode(True)
+            logger.debug("Low-latency mode enabled on %s", self.port)
+        except (AttributeError, ValueError) as e:
+            # Not a POSIX port, or the driver does not support the flag
+            logger.debug("Low-latency mode not available on %s: %s", self.port, e)
+    
+    def _try_connect(self, conn: serial.Serial, baudrate: int) -> bool:
         try:
-            test_serial = serial.Serial(port=self.port, baudrate=baudrate, timeout=2.0)
-            if self._test_communication(test_serial):
-                self.serial_conn = test_serial
-                self.nmea_reader = NMEAReader(test_serial)
+            conn.baudrate = baudrate
+            # Drop bytes garbled at the previous baudrate
+            conn.reset_input_buffer()
+            if self._test_communication(conn):
+                self.serial_conn = conn
+                self.line_reader = SerialLineReader(conn)
                 logger.info(f"✅ GPS connected at {baudrate} baud")
                 return True
-            test_serial.close()
         except Exception as e:
             logger.debug(f"Failed at {baudrate}: {e}")
         return False
     
-    def _test_communication(self, conn: serial.Serial) -> bool:
+    def _test_communication(self, conn: serial.Serial, timeout: float = 1.5) -> bool:
         logger.debug("🔍 Testing GPS communication...")
-        start_time = time.time()
-        while time.time() - start_time < 3.0:
-            if conn.in_waiting > 0:
-                data = conn.read(conn.in_waiting)
-                if b'$' in data and b'*' in data:
+        deadline = time.monotonic() + timeout
+        received = bytearray()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Sleep in the kernel until bytes arrive instead of polling in_waiting
+            readable, _, _ = select.select([conn.fileno()], [], [], remaining)
+            if readable:
+                received += conn.read(conn.in_waiting or 1)
+                if b'$' in received and b'*' in received:
                   #  logger.debug(f"📡 GPS communication OK - received NMEA data")
                     return True
-            time.sleep(0.1)
         logger.debug("❌ No valid NMEA data received")
         return False
     
@@ -75,17 +220,7 @@ class LC29HGPS(GPS):
         if self.serial_conn.in_waiting:
             self.serial_conn.read(self.serial_conn.in_waiting)
 
-        # Configuration commands sequence: (command_bytes, description)
-        configuration_commands = [
-            (b"$PAIR062,0,1*3E\r\n", "Enable GGA 1Hz"),
-            (b"$PAIR062,1,0*3F\r\n", "Disable GLL"),
-            (b"$PAIR062,2,0*3C\r\n", "Disable GSA"),
-            (b"$PAIR062,3,0*3D\r\n", "Disable GSV"),
-            (b"$PAIR062,4,0*3A\r\n", "Disable RMC"),
-            (b"$PAIR062,5,1*3B\r\n", "Enabled VTG"),
-        ]
-
-        for cmd, desc in configuration_commands:
+        for cmd, desc in LC29H_CONFIG_COMMANDS:
             self._send_nmea_command(cmd, desc)
 
         logger.info("✅ Configuration commands sent successfully.")
@@ -115,63 +250,73 @@ class LC29HGPS(GPS):
             return False
     
     def read_position(self) -> Optional[Position]:
-        if not self.nmea_reader or not self.serial_conn:
+        if not self.line_reader or not self.serial_conn:
             return None
             
         try:
-            raw_data, parsed_data = self.nmea_reader.read()
-            if raw_data and parsed_data:
-                return self._parse_position(parsed_data)
+            # Keep reading past sentences that carry no position (VTG, GSV, ...) -
+            # returning None for each would send the caller into its idle sleep
+            # with the rest of the epoch still queued. Empty means the port timed out.
+            # A GGA ends the search with or without a fix, and the line budget covers
+            # streams with no GGA at all, so a receiver without a fix cannot keep
+            # the caller in here (and stop() waiting on it) forever.
+            for _ in range(self._MAX_LINES_PER_READ):
+                raw_data = self.line_reader.readline()
+                if not raw_data:
+                    break
+                position = self._parse_position(raw_data, time.monotonic())
+                if position or raw_data[3:6] == b'GGA':
+                    return position
         except Exception as e:
-            logger.debug(f"Read error: {e}")
+            logger.debug("Read error: %s", e)
         return None
     
-    def _parse_position(self, nmea_msg: NMEAMessage) -> Optional[Position]:
-        if not hasattr(nmea_msg, 'msgID'):
+    def _parse_position(self, raw_data: bytes, now: float) -> Optional[Position]:
+        if len(raw_data) < 6 or raw_data[0] != 0x24:  # '$'
             return None
             
-        msg_type = nmea_msg.msgID
+        msg_type = raw_data[3:6]
         
         # Only process important messages
-        if msg_type == 'GGA':
-            self._last_gga_time = time.time()
-            return self._parse_gga(nmea_msg)
-        elif msg_type == 'VTG':
-            self._last_vtg_time = time.time()
-            speed, heading = NMEANavigationParser.parse_vtg_navigation(nmea_msg)
-            if speed is not None:
-                self.last_speed = speed
-            if heading is not None:
-                self.last_heading = heading
-            logger.debug(f"📡 VTG update - Speed: {self.last_speed} kn, Heading: {self.last_heading}°")
-            return None  # VTG does not provide position directly
-        elif msg_type in ['GSA', 'GSV', 'RMC']:
-            # Common NMEA messages - silently ignore
-            pass
-        else:
+        handler = self._dispatch.get(msg_type)
+        if handler:
+            return handler(raw_data, now)
+        if msg_type not in self._SILENT_SENTENCES:
             # Log unknown messages occasionally
-            logger.debug(f"📡 Unknown NMEA message type: {msg_type}")
+            logger.debug("📡 Unknown NMEA message type: %r", msg_type)
         return None
     
-    def _parse_gga(self, gga: NMEAMessage) -> Optional[Position]:
+    def _handle_gga(self, raw_data: bytes, now: float) -> Optional[Position]:
+        self._last_gga_time = now
+        return self._parse_gga(raw_data, now)
+    
+    def _handle_vtg(self, raw_data: bytes, now: float) -> Optional[Position]:
+        self._last_vtg_time = now
+        nmea_msg = NMEAReader.parse(raw_data)
+        if nmea_msg is None:
+            return None
+        speed, heading = NMEANavigationParser.parse_vtg_navigation(nmea_msg)
+        if speed is not None:
+            self.last_speed = speed
+        if heading is not None:
+            self.last_heading = heading
+        logger.debug("📡 VTG update - Speed: %s kn, Heading: %s°", self.last_speed, self.last_heading)
+        return None  # VTG does not provide position directly
+    
+    def _parse_gga(self, raw_gga: bytes, now: float) -> Optional[Position]:
+        """Parse a raw GGA sentence; `now` is the time.monotonic() read time"""
         try:
-            # Basic structure validation
-            if not hasattr(gga, 'lat') or not hasattr(gga, 'lon'):
-                logger.warning("📡 GGA message missing lat/lon attributes")
-                return None
+            # Decode all fields in one pass over the raw sentence
+            decoded = parse_gga_bytes(raw_gga)
+            status, lat, lon = decoded[0], decoded[1], decoded[2]
             
-            # Check if position data is available (not None/empty)
-            if gga.lat is None or gga.lon is None or gga.lat == '' or gga.lon == '':
-                logger.debug("📡 GGA message has empty lat/lon data")
+            if status == GGA_MALFORMED:
+                logger.warning("📡 GGA: Malformed sentence or checksum mismatch")
                 return None
             
-            # Parse and validate coordinates
-            try:
-                lat = float(gga.lat)
-                lon = float(gga.lon)
-                
-            except (ValueError, TypeError) as e:
-                logger.warning(f"📡 GGA: Invalid lat/lon format - lat={gga.lat}, lon={gga.lon}: {e}")
+            # Check if position data is available (not empty)
+            if status == GGA_NO_POSITION:
+                logger.debug("📡 GGA message has empty lat/lon data")
                 return None
             
             # Validate coordinate ranges
@@ -183,90 +328,46 @@ class LC29HGPS(GPS):
                 logger.warning(f"📡 GGA: Invalid longitude {lon} (must be -180 to 180)")
                 return None
             
-            # Parse altitude with validation
-            altitude = 0.0
-            if hasattr(gga, 'alt') and gga.alt is not None and gga.alt != '':
-                try:
-                    altitude = float(gga.alt)
-                    # Sanity check for altitude (-1000m to 10000m)
-                    if not (-1000.0 <= altitude <= 10000.0):
-                        logger.warning(f"📡 GGA: Suspicious altitude {altitude}m")
-                except (ValueError, TypeError):
-                    logger.warning(f"📡 GGA: Invalid altitude format: {gga.alt}")
+            # Validate remaining fields in a single pass over the table
+            validated = []
+            for (name, kind, lo, hi, default, clamp), value in zip(self._GGA_FIELDS, decoded[3:7]):
+                if (value != value) if kind is float else (value < 0):
+                    value = default  # Empty field
+                elif not (lo <= value <= hi):
+                    logger.warning(f"📡 GGA: Suspicious {name} {value}")
+                    value = max(lo, min(hi, value)) if clamp else default
+                validated.append(value)
+            altitude, satellites, hdop, quality = validated
+            diff_age = decoded[7]
             
-            # Parse satellites count with validation
-            satellites = 0
-            if hasattr(gga, 'numSV') and gga.numSV is not None and gga.numSV != '':
-                try:
-                    satellites = int(gga.numSV)
-                    # Validate satellite count (0-50 is reasonable range)
-                    if not (0 <= satellites <= 50):
-                        logger.warning(f"📡 GGA: Suspicious satellite count {satellites}")
-                        satellites = max(0, min(50, satellites))  # Clamp to valid range
-                except (ValueError, TypeError):
-                    logger.warning(f"📡 GGA: Invalid satellite count format: {gga.numSV}")
+            # Map quality to RTK status (quality is already validated to 0-9)
+            rtk_status = self._QUALITY_TO_RTK[quality]
             
-            # Parse HDOP with validation
-            hdop = 0.0
-            if hasattr(gga, 'HDOP') and gga.HDOP is not None and gga.HDOP != '':
-                try:
-                    hdop = float(gga.HDOP)
-                    # Validate HDOP (0-50 is reasonable range)
-                    if not (0.0 <= hdop <= 50.0):
-                        logger.warning(f"📡 GGA: Suspicious HDOP {hdop}")
-                        hdop = max(0.0, min(50.0, hdop))  # Clamp to valid range
-                except (ValueError, TypeError):
-                    logger.warning(f"📡 GGA: Invalid HDOP format: {gga.HDOP}")
-            
-            # Parse quality indicator with validation
-            quality = 0
-            if hasattr(gga, 'quality') and gga.quality is not None and gga.quality != '':
-                try:
-                    quality = int(gga.quality)
-                    # Validate quality range (0-9 according to NMEA spec)
-                    if not (0 <= quality <= 9):
-                        logger.warning(f"📡 GGA: Invalid quality indicator {quality}")
-                        quality = 0
-                except (ValueError, TypeError):
-                    logger.warning(f"📡 GGA: Invalid quality format: {gga.quality}")
-            
-            # Map quality to RTK status
-            quality_map = {
-                0: RTKStatus.NO_FIX,        # No fix
-                1: RTKStatus.SINGLE,        # GPS fix (SPS)
-                2: RTKStatus.DGPS,          # DGPS fix
-                3: RTKStatus.SINGLE,        # PPS fix (treat as single)
-                4: RTKStatus.RTK_FIXED,     # RTK fixed
-                5: RTKStatus.RTK_FLOAT,     # RTK float
-            }
-            
-            rtk_status = quality_map.get(quality, RTKStatus.NO_FIX)
-            
-            # Get diffAge for logging if available
-            diff_age = getattr(gga, 'diffAge', 'N/A')
-            current_time = time.time()
+            # diffAge for logging if available
+            if diff_age != diff_age:
+                diff_age = 'N/A'
             status_changed = self._last_rtk_status != rtk_status
-            should_log_position = (current_time - self._last_position_log >= self._position_log_interval) or status_changed
+            should_log_position = (now - self._last_position_log >= self._position_log_interval) or status_changed
             
             if should_log_position:
                 if quality == 4:  # RTK Fixed - special success logging
-                    logger.info(f"🎯 RTK FIXED! Lat={lat:.6f}, Lon={lon:.6f}, Alt={altitude:.1f}m, "
-                               f"Sats={satellites}, HDOP={hdop:.1f}, DiffAge={diff_age}s")
+                    logger.info("🎯 RTK FIXED! Lat=%.6f, Lon=%.6f, Alt=%.1fm, Sats=%d, HDOP=%.1f, DiffAge=%ss",
+                                lat, lon, altitude, satellites, hdop, diff_age)
                 elif quality == 5:  # RTK Float
-                    logger.info(f"🔶 RTK FLOAT: Lat={lat:.6f}, Lon={lon:.6f}, Alt={altitude:.1f}m, "
-                               f"Sats={satellites}, HDOP={hdop:.1f}, DiffAge={diff_age}s")
+                    logger.info("🔶 RTK FLOAT: Lat=%.6f, Lon=%.6f, Alt=%.1fm, Sats=%d, HDOP=%.1f, DiffAge=%ss",
+                                lat, lon, altitude, satellites, hdop, diff_age)
                 else:
-                    logger.info(f"📍 GGA: Lat={lat:.6f}, Lon={lon:.6f}, Alt={altitude:.1f}m, "
-                               f"Sats={satellites}, HDOP={hdop:.1f}, Quality={quality}({rtk_status.value})")
+                    logger.info("📍 GGA: Lat=%.6f, Lon=%.6f, Alt=%.1fm, Sats=%d, HDOP=%.1f, Quality=%d(%s)",
+                                lat, lon, altitude, satellites, hdop, quality, rtk_status.value)
                 
-                self._last_position_log = current_time
+                self._last_position_log = now
                 self._last_rtk_status = rtk_status
             if quality == 0:
                 logger.debug("📡 GGA: No fix available")
             elif satellites < 4 and quality > 0:
                 logger.warning(f"📡 GGA: Fix claimed with insufficient satellites ({satellites})")
 
-            vtg_age = current_time - self._last_vtg_time if self._last_vtg_time > 0 else float('inf')
+            vtg_age = now - self._last_vtg_time if self._last_vtg_time > 0 else float('inf')
             
             # 🔧 NEW: Validate heading based on speed - VTG heading is unreliable when stationary
             MIN_SPEED_FOR_HEADING = 0.5  # m/s - minimum speed for reliable heading (1.8 km/h)
@@ -276,11 +377,11 @@ class LC29HGPS(GPS):
             if vtg_age < 5.0 and self.last_heading is not None:
                 if speed is not None and speed >= MIN_SPEED_FOR_HEADING:
                     heading = self.last_heading  # ✅ Heading reliable - robot is moving
-                    logger.debug(f"📡 Using VTG heading {heading:.1f}° (speed={speed:.2f} m/s)")
+                    logger.debug("📡 Using VTG heading %.1f° (speed=%.2f m/s)", heading, speed)
                 else:
                     heading = None  # ❌ Heading unreliable - robot stationary or moving too slow
                     if speed is not None:
-                        logger.debug(f"📡 VTG heading ignored - speed too low ({speed:.2f} m/s < {MIN_SPEED_FOR_HEADING})")
+                        logger.debug("📡 VTG heading ignored - speed too low (%.2f m/s < %s)", speed, MIN_SPEED_FOR_HEADING)
             
             return Position(
                 lat=lat,
@@ -289,40 +390,46 @@ class LC29HGPS(GPS):
                 satellites=satellites,
                 hdop=hdop,
                 rtk_status=rtk_status,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=self._iso_timestamp(),
                 heading=heading,
                 speed=speed
             )
             
         except Exception as e:
-            logger.error(f"📡 GGA parsing error: {e}", exc_info=True)
+            # Render the traceback at most once per interval - a corrupt stream
+            # can fail on every sentence
+            with_traceback = now - self._last_exc_log >= self._exc_log_interval
+            if with_traceback:
+                self._last_exc_log = now
+            logger.error(f"📡 GGA parsing error: {e}", exc_info=with_traceback)
             return None
     
-    def _parse_gll(self, gll: NMEAMessage) -> Optional[Position]:
-        # Log ALL GLL attributes for detailed debugging
-        gll_attrs = {}
-        for attr in dir(gll):
-            if not attr.startswith('_') and hasattr(gll, attr):
-                try:
-                    value = getattr(gll, attr)
-                    if not callable(value):
-                        gll_attrs[attr] = value
-                except:
-                    pass
-        
-        logger.info(f"🔍 GLL DETAILED: {gll_attrs}")
-        
-        if not (hasattr(gll, 'lat') and hasattr(gll, 'lon')):
+    def _iso_timestamp(self) -> str:
+        now = int(time.time())
+        cached = self._ts_cache
+        if cached[0] == now:
+            return cached[1]
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        self._ts_cache = (now, stamp)
+        return stamp
+    
+    def _parse_gll(self, raw_gll: bytes) -> Optional[Position]:
+        # $xxGLL,lat,N/S,lon,E/W,time,status,mode*hh
+        fields = raw_gll.split(b'*', 1)[0].decode('ascii', errors='ignore').split(',')
+        if len(fields) < 7:
             logger.warning("📡 GLL message missing lat/lon data")
             return None
         
-        # Parse coordinates (pynmeagps already returns decimal degrees)
-        lat = float(gll.lat) if gll.lat else 0.0
-        lon = float(gll.lon) if gll.lon else 0.0
-        status = gll.status if hasattr(gll, 'status') else 'V'
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 GLL: lat=%s lon=%s status=%s", fields[1], fields[3], fields[6])
+        
+        # Convert ddmm.mmmm with integer minutes to keep sub-cm precision
+        lat = nmea_to_degrees(fields[1], fields[2]) or 0.0
+        lon = nmea_to_degrees(fields[3], fields[4]) or 0.0
+        status = fields[6] or 'V'
         rtk_status = RTKStatus.SINGLE if status == 'A' else RTKStatus.NO_FIX
         
-        logger.info(f"📍 GLL: Lat={lat:.6f}, Lon={lon:.6f}, Status={status}({rtk_status.value}) [FALLBACK]")
+        logger.info("📍 GLL: Lat=%.6f, Lon=%.6f, Status=%s(%s) [FALLBACK]", lat, lon, status, rtk_status.value)
             
         return Position(
             lat=lat,
@@ -331,41 +438,41 @@ class LC29HGPS(GPS):
             satellites=0,
             hdop=0.0,
             rtk_status=rtk_status,
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ")
+            timestamp=self._iso_timestamp()
         )
     
     def write_rtcm(self, data: bytes) -> bool:
-        if self.serial_conn:
-            try:
-                if len(data) > 0:
-                    # Optimized RTCM parsing with throttled logging
-                    self._rtcm_message_count += 1
-                    current_time = time.time()
-                    
-                    if data[0] == 0xD3:
-                        if len(data) >= 6:
-                            try:
-                                header = struct.unpack('>I', b'\x00' + data[0:3])[0]
-                                length = header & 0x3FF
-                                if len(data) >= 5:  # Header + at least 2 bytes for message type
-                                    msg_type = struct.unpack('>H', data[3:5])[0] >> 4
-                      
-                            except Exception as e:
-                                logger.debug(f"Could not extract RTCM message details: {e}")
-                        
-                        # Write data to GPS - this is the critical part
-                        bytes_written = self.serial_conn.write(data)
-                       # logger.info(f"📡 RTCM: Sending {len(data)} bytes to GPS: {data[:20].hex()}...")
-                        return bytes_written == len(data)
-                    else:
-                        logger.warning(f"⚠️ RTCM: Invalid preamble 0x{data[0]:02X} (expected 0xD3)")
-                
-                self.serial_conn.write(data)
-                return True
-            except Exception as e:
-                logger.error(f"❌ RTCM write failed: {e}")
-        else:
+        return self.write_rtcm_batch([data])
+    
+    def write_rtcm_batch(self, frames: List[bytes]) -> bool:
+        """Write several RTCM frames to the GPS with a single serial write"""
+        if not self.serial_conn:
             logger.warning("⚠️ Cannot write RTCM - GPS not connected")
+            return False
+            
+        try:
+            valid_frames = [frame for frame in frames if frame and frame[0] == 0xD3]
+            if len(valid_frames) != len(frames):
+                logger.warning("⚠️ RTCM: Dropped %d frame(s) with invalid preamble (expected 0xD3)",
+                               len(frames) - len(valid_frames))
+            if not valid_frames:
+                return False
+            
+            self._rtcm_message_count += len(valid_frames)
+            if logger.isEnabledFor(logging.DEBUG):
+                for data in valid_frames:
+                    if len(data) >= 6:
+                        # 10-bit length in header bytes 1-2, 12-bit type in bytes 3-4
+                        length = ((data[1] & 0x03) << 8) | data[2]
+                        msg_type = (data[3] << 4) | (data[4] >> 4)
+                        logger.debug("📡 RTCM %d: %d byte payload → GPS", msg_type, length)
+            
+            # Write data to GPS - this is the critical part
+            payload = valid_frames[0] if len(valid_frames) == 1 else b''.join(valid_frames)
+            bytes_written = self.serial_conn.write(payload)
+            return bytes_written == len(payload)
+        except Exception as e:
+            logger.error(f"❌ RTCM write failed: {e}")
         return False
     
     def close(self):
@@ -373,7 +480,7 @@ class LC29HGPS(GPS):
             logger.info("🔌 Closing GPS connection")
             self.serial_conn.close()
             self.serial_conn = None
-            self.nmea_reader = None
+            self.line_reader = None
         else:
             logger.debug("GPS connection already closed")
     
@@ -42,6 +42,10 @@ class GPS(ABC):
     @abstractmethod
     def write_rtcm(self, data: bytes) -> bool: pass
     
+    def write_rtcm_batch(self, frames: List[bytes]) -> bool:
+        # Adapters that can coalesce frames into one write should override this
+        return all([self.write_rtcm(frame) for frame in frames])
+    
     @abstractmethod
     def close(self): pass
     
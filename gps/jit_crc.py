@@ -0,0 +1,147 @@
+"""
+Compiled CRC-24Q and RTCM frame scan kernels
+
+Slice-by-16 CRC-24Q for RTCM 3 frames: sixteen lookup tables let one loop
+iteration fold sixteen payload bytes into the CRC. scan_rtcm_frames walks a
+whole receive buffer - preamble search, length decode and CRC - in one
+compiled call. Only worthwhile when compiled, so crc24q and scan_rtcm_frames
+are None unless numba (and numpy, which it depends on) is installed -
+callers keep their pure-Python paths as the fallback.
+"""
+try:
+    import numpy as np
+    from numba import njit
+    JIT_ENABLED = True
+except ImportError:
+    JIT_ENABLED = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+CRC24Q_POLY = 0x1864CFB
+_SLICES = 16
+
+
+def build_crc24q_tables(slices=_SLICES):
+    """
+    Return slice-by-N tables as nested lists: tables[k][b] is the CRC
+    contribution of byte b followed by k zero bytes.
+    """
+    base = []
+    for byte in range(256):
+        crc = byte << 16
+        for _ in range(8):
+            crc <<= 1
+            if crc & 0x1000000:
+                crc ^= CRC24Q_POLY
+        base.append(crc & 0xFFFFFF)
+
+    tables = [base]
+    for _ in range(1, slices):
+        prev = tables[-1]
+        tables.append([((c << 8) & 0xFFFFFF) ^ base[c >> 16] for c in prev])
+    return tables
+
+
+@njit(cache=True)
+def _crc24q_sb16(buf, i, n, tables):
+    """CRC-24Q of buf[i:n]"""
+    crc = 0
+    # The 24-bit register folds into the first three bytes of each block
+    while i + _SLICES <= n:
+        crc = (tables[15][buf[i] ^ (crc >> 16)]
+               ^ tables[14][buf[i + 1] ^ ((crc >> 8) & 0xFF)]
+               ^ tables[13][buf[i + 2] ^ (crc & 0xFF)]
+               ^ tables[12][buf[i + 3]]
+               ^ tables[11][buf[i + 4]]
+               ^ tables[10][buf[i + 5]]
+               ^ tables[9][buf[i + 6]]
+               ^ tables[8][buf[i + 7]]
+               ^ tables[7][buf[i + 8]]
+               ^ tables[6][buf[i + 9]]
+               ^ tables[5][buf[i + 10]]
+               ^ tables[4][buf[i + 11]]
+               ^ tables[3][buf[i + 12]]
+               ^ tables[2][buf[i + 13]]
+               ^ tables[1][buf[i + 14]]
+               ^ tables[0][buf[i + 15]])
+        i += _SLICES
+    base = tables[0]
+    while i < n:
+        crc = ((crc << 8) & 0xFFFFFF) ^ base[(crc >> 16) ^ buf[i]]
+        i += 1
+    return crc
+
+
+@njit(cache=True)
+def _scan_frames(buf, n, tables, strict, offsets, lengths, valid):
+    """
+    Record every complete frame candidate in buf[:n]
+
+    Mirrors RTCMParser._extract_messages: a frame that fails its CRC advances
+    the search by one byte when strict, past the whole frame otherwise.
+
+    Returns:
+        Tuple (count, consumed, discarded) - candidates written to the
+        output arrays, bytes the caller can drop, and how many of those
+        were skipped while hunting for a preamble.
+    """
+    count = 0
+    head = 0
+    discarded = 0
+    while head < n:
+        start = head
+        while head < n and buf[head] != 0xD3:
+            head += 1
+        discarded += head - start
+        if n - head < 3:
+            break
+        length = ((buf[head + 1] & 0x03) << 8) | buf[head + 2]
+        if length == 0:
+            head += 1
+            continue
+        end = head + 3 + length
+        if end + 3 > n:
+            break
+        received = (buf[end] << 16) | (buf[end + 1] << 8) | buf[end + 2]
+        ok = _crc24q_sb16(buf, head, end, tables) == received
+        offsets[count] = head
+        lengths[count] = length
+        valid[count] = ok
+        count += 1
+        head = head + 1 if strict and not ok else end + 3
+    return count, head, discarded
+
+
+if JIT_ENABLED:
+    # int64 rather than uint32 so the register keeps a single integer type under numba
+    _TABLES = np.array(build_crc24q_tables(), dtype=np.int64)
+
+    def crc24q(data) -> int:
+        """CRC-24Q of a bytes-like object"""
+        buf = np.frombuffer(data, dtype=np.uint8)
+        return int(_crc24q_sb16(buf, 0, buf.shape[0], _TABLES))
+
+    def scan_rtcm_frames(data, strict_resync=True):
+        """
+        Locate RTCM frames in a bytes-like buffer
+
+        Returns:
+            Tuple (frames, consumed, discarded) where frames is a list of
+            (offset, payload_length, crc_ok) tuples.
+        """
+        buf = np.frombuffer(data, dtype=np.uint8)
+        n = buf.shape[0]
+        # A candidate is recorded at most once per byte of input
+        offsets = np.empty(n, dtype=np.int64)
+        lengths = np.empty(n, dtype=np.int64)
+        valid = np.empty(n, dtype=np.bool_)
+        count, consumed, discarded = _scan_frames(
+            buf, n, _TABLES, strict_resync, offsets, lengths, valid)
+        frames = [(int(offsets[i]), int(lengths[i]), bool(valid[i])) for i in range(count)]
+        return frames, int(consumed), int(discarded)
+else:
+    crc24q = None
+    scan_rtcm_frames = None
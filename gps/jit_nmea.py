@@ -0,0 +1,186 @@
+"""
+Compiled GGA field decoder
+
+Decodes a raw GGA sentence straight from the serial bytes into scalars,
+without building an NMEAMessage. Numbers are accumulated as integers and
+divided once, so ddmm.mmmm coordinates keep their full precision.
+
+Numba is optional - when it is not installed the same functions run as
+plain Python.
+"""
+try:
+    from numba import njit
+    JIT_ENABLED = True
+except ImportError:
+    JIT_ENABLED = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Decoder status codes (first element of the returned tuple)
+GGA_OK = 0
+GGA_MALFORMED = 1      # Not a GGA sentence, bad checksum or missing fields
+GGA_NO_POSITION = 2    # Valid sentence but lat/lon fields are empty
+
+_MAX_FIELDS = 16
+_NAN = float('nan')
+
+_COMMA = 44
+_DOT = 46
+_MINUS = 45
+_STAR = 42
+_DOLLAR = 36
+
+
+@njit(cache=True)
+def _hex_value(c):
+    if 48 <= c <= 57:
+        return c - 48
+    if 65 <= c <= 70:
+        return c - 55
+    if 97 <= c <= 102:
+        return c - 87
+    return -1
+
+
+@njit(cache=True)
+def _parse_number(buf, start, end):
+    """Return (negative, integer_digits, fraction_digits, decimals, ok)"""
+    negative = False
+    int_part = 0
+    frac_part = 0
+    decimals = 0
+    seen_dot = False
+    digits = 0
+    i = start
+    if i < end and buf[i] == _MINUS:
+        negative = True
+        i += 1
+    while i < end:
+        c = buf[i]
+        if c == _DOT:
+            if seen_dot:
+                return negative, 0, 0, 0, False
+            seen_dot = True
+        elif 48 <= c <= 57:
+            if seen_dot:
+                frac_part = frac_part * 10 + (c - 48)
+                decimals += 1
+            else:
+                int_part = int_part * 10 + (c - 48)
+            digits += 1
+        else:
+            return negative, 0, 0, 0, False
+        i += 1
+    return negative, int_part, frac_part, decimals, digits > 0
+
+
+@njit(cache=True)
+def _parse_float(buf, start, end):
+    if start >= end:
+        return _NAN
+    negative, int_part, frac_part, decimals, ok = _parse_number(buf, start, end)
+    if not ok:
+        return _NAN
+    scale = 10 ** decimals
+    value = (int_part * scale + frac_part) / scale
+    return -value if negative else value
+
+
+@njit(cache=True)
+def _parse_int(buf, start, end):
+    if start >= end:
+        return -1
+    negative, int_part, frac_part, decimals, ok = _parse_number(buf, start, end)
+    if not ok or negative or decimals:
+        return -1
+    return int_part
+
+
+@njit(cache=True)
+def _parse_coordinate(buf, start, end, hemi):
+    """Convert a ddmm.mmmm / dddmm.mmmm field to signed decimal degrees"""
+    if start >= end:
+        return _NAN
+    negative, int_part, frac_part, decimals, ok = _parse_number(buf, start, end)
+    if not ok or negative:
+        return _NAN
+    degrees = int_part // 100
+    scale = 10 ** decimals
+    minutes_scaled = (int_part % 100) * scale + frac_part
+    value = degrees + minutes_scaled / (60.0 * scale)
+    if hemi == 83 or hemi == 87:  # 'S' / 'W'
+        return -value
+    return value
+
+
+@njit(cache=True)
+def parse_gga_bytes(buf):
+    """
+    Decode a raw GGA sentence
+
+    Args:
+        buf: Sentence bytes, e.g. b'$GNGGA,...*hh\\r\\n'
+
+    Returns:
+        Tuple (status, lat, lon, alt, num_sv, hdop, quality, diff_age).
+        Empty float fields are NaN and empty integer fields are -1.
+    """
+    n = len(buf)
+    while n > 0 and (buf[n - 1] == 10 or buf[n - 1] == 13):
+        n -= 1
+
+    if n < 7 or buf[0] != _DOLLAR or buf[3] != 71 or buf[4] != 71 or buf[5] != 65:
+        return GGA_MALFORMED, _NAN, _NAN, _NAN, -1, _NAN, -1, _NAN
+
+    # Verify checksum when present
+    end = n
+    checksum = 0
+    star = -1
+    for i in range(1, n):
+        c = buf[i]
+        if c == _STAR:
+            star = i
+            break
+        checksum ^= c
+    if star != -1:
+        if star + 3 > n:
+            return GGA_MALFORMED, _NAN, _NAN, _NAN, -1, _NAN, -1, _NAN
+        hi = _hex_value(buf[star + 1])
+        lo = _hex_value(buf[star + 2])
+        if hi < 0 or lo < 0 or (hi << 4 | lo) != checksum:
+            return GGA_MALFORMED, _NAN, _NAN, _NAN, -1, _NAN, -1, _NAN
+        end = star
+
+    # Index field boundaries: field k spans starts[k] .. starts[k + 1] - 1
+    starts = [0] * (_MAX_FIELDS + 2)
+    count = 0
+    starts[0] = 0
+    for i in range(end):
+        if buf[i] == _COMMA:
+            count += 1
+            if count >= _MAX_FIELDS:
+                break
+            starts[count] = i + 1
+    starts[count + 1] = end + 1
+
+    if count < 14:
+        return GGA_MALFORMED, _NAN, _NAN, _NAN, -1, _NAN, -1, _NAN
+
+    lat_hemi = buf[starts[3]] if starts[4] - 1 > starts[3] else 0
+    lon_hemi = buf[starts[5]] if starts[6] - 1 > starts[5] else 0
+
+    lat = _parse_coordinate(buf, starts[2], starts[3] - 1, lat_hemi)
+    lon = _parse_coordinate(buf, starts[4], starts[5] - 1, lon_hemi)
+    quality = _parse_int(buf, starts[6], starts[7] - 1)
+    num_sv = _parse_int(buf, starts[7], starts[8] - 1)
+    hdop = _parse_float(buf, starts[8], starts[9] - 1)
+    alt = _parse_float(buf, starts[9], starts[10] - 1)
+    diff_age = _parse_float(buf, starts[13], starts[14] - 1)
+
+    if lat != lat or lon != lon:
+        return GGA_NO_POSITION, lat, lon, alt, num_sv, hdop, quality, diff_age
+
+    return GGA_OK, lat, lon, alt, num_sv, hdop, quality, diff_age
@@ -1,21 +1,33 @@
+import os
 import socket
+import selectors
 import base64
+import random
 import time
 import threading
 import logging
 import ssl
 from typing import Optional, Callable, Dict, Any
-from config.nmea_utils import build_dummy_gga
+from config.nmea_utils import build_dummy_gga_bytes
 from .rtcm_parser import RTCMParser, RTCMValidator, RTCMMessage
 
 logger = logging.getLogger(__name__)
 
 NTRIP_RECONNECT_INTERVAL = 1.0 
+NTRIP_MAX_RECONNECT_DELAY = 30.0
 NTRIP_MAX_RECONNECT_ATTEMPTS = 5
 NTRIP_CONNECTION_TIMEOUT = 10.0
 NTRIP_DATA_TIMEOUT = 3.0
-NTRIP_RESPONSE_BUFFER_SIZE = 4096
+NTRIP_GGA_INTERVAL = 1.0
+NTRIP_RESPONSE_BUFFER_SIZE = 65536
+NTRIP_SOCKET_RCVBUF = 262144
 NTRIP_USER_AGENT = "RTKRover/1.0"
+NTRIP_KEEPALIVE_IDLE = 10  # seconds
+NTRIP_KEEPALIVE_INTERVAL = 5  # seconds
+NTRIP_KEEPALIVE_COUNT = 3
+NTRIP_USER_TIMEOUT_MS = 15000
+NTRIP_MAX_HEADER_SIZE = 16384
+NTRIP_ACCEPT_STATUS = (b"ICY 200 OK", b"HTTP/1.0 200 OK", b"HTTP/1.1 200 OK")
 
 class NTRIPError(Exception):
     """Base exception for NTRIP-related errors"""
@@ -29,28 +41,81 @@ class NTRIPAuthenticationError(NTRIPError):
     """Exception for authentication-related errors"""
     pass
 
+# Rejections worth a specific message, keyed by HTTP status code
+NTRIP_STATUS_ERRORS = {
+    b"401": (NTRIPAuthenticationError, "Unauthorized - check username/password"),
+    b"404": (NTRIPConnectionError, "Mount point not found"),
+}
+
 class NTRIPClient:
+    # Fixed attribute layout - the receive loop reads several of these per chunk
+    __slots__ = (
+        'config', 'gga_callback', 'socket', 'connected', 'running',
+        'bytes_received', 'recv_calls', 'connection_attempts', '_last_data_mono',
+        '_data_thread', '_lock', '_selector', '_wake_r', '_wake_w',
+        '_rx_buf', '_rx_view', '_pending_data', '_hdr_buf', '_hdr_view',
+        '_cached_dummy_gga', '_dummy_gga_second', '_last_gga_sent',
+        'rtcm_parser', 'rtcm_validator', 'use_ssl', 'verbose', '_ssl_context',
+        '_rng', 'auth_b64', '_request_bytes', '_stats_config',
+    )
+    
     def __init__(self, config: Dict[str, Any], gga_callback: Optional[Callable] = None):
         self.config = config
-        self.gga_callback = gga_callback
+        self.gga_callback: Optional[Callable[[], Optional[bytes]]] = gga_callback
         self.socket: Optional[socket.socket] = None
         self.connected = False
         self.running = False
         self.bytes_received = 0
+        self.recv_calls = 0
         self.connection_attempts = 0
-        self.last_data_time = 0
+        self._last_data_mono = 0.0  # monotonic time of the last received chunk
         self._data_thread: Optional[threading.Thread] = None
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        
+        # Owned by the data reception thread: socket readiness + wake-up pipe
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        
+        # Reused receive buffer - recv_into() avoids a new bytes object per wakeup
+        self._rx_buf = bytearray(NTRIP_RESPONSE_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
+        self._pending_data = b''
+        
+        # Reused across connect/reconnect for the caster's response header
+        self._hdr_buf = bytearray(NTRIP_MAX_HEADER_SIZE)
+        self._hdr_view = memoryview(self._hdr_buf)
         
-        self.rtcm_parser = RTCMParser()
+        self._cached_dummy_gga = b''
+        self._dummy_gga_second = -1
+        self._last_gga_sent = 0.0  # monotonic time of the last caller-supplied GGA
+        
+        self.rtcm_parser = RTCMParser(strict_resync=config.get('strict_resync', True))
         self.rtcm_validator = RTCMValidator()
         
+        self.use_ssl = config.get('ssl', False)
+        self.verbose = config.get('verbose', False)
+        self._ssl_context = ssl.create_default_context() if self.use_ssl else None
+        
         self._validate_config()
         
+        # Per-client RNG so several clients in one process don't reconnect in lockstep
+        self._rng = random.Random(hash((config['caster'], config['mountpoint'], id(self))))
+        
         self._prepare_auth()
         
-        self.use_ssl = config.get('ssl', False)
-        self.verbose = config.get('verbose', False)
+        # Caster, mountpoint and credentials are fixed - build the request once
+        self._request_bytes = self._build_request()
+        
+        # Reported by get_statistics(); fixed for the client's lifetime, so built once
+        # and copied per call - the statistics are serialised to JSON
+        self._stats_config = {
+            'caster': config['caster'],
+            'port': config['port'],
+            'mountpoint': config['mountpoint'],
+            'username': config['username'][:3] + '***' if config['username'] else 'None',
+            'ssl': self.use_ssl
+        }
         
     def _validate_config(self):
         required_fields = ['caster', 'port', 'mountpoint', 'username', 'password']
@@ -66,36 +131,41 @@ class NTRIPClient:
     
     def _prepare_auth(self):
         auth_string = f"{self.config['username']}:{self.config['password']}"
-        self.auth_b64 = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
+        self.auth_b64 = base64.b64encode(auth_string.encode('utf-8'))
     
     def _build_request(self) -> bytes:
         mountpoint = self.config["mountpoint"]
         if not mountpoint.startswith('/'):
             mountpoint = f"/{mountpoint}"
         
-        request_string = f"GET {mountpoint} HTTP/1.1\r\n"
-        request_string += f"User-Agent: {NTRIP_USER_AGENT}\r\n"
-        request_string += f"Authorization: Basic {self.auth_b64}\r\n"
-        request_string += f"Host: {self.config['caster']}:{self.config['port']}\r\n"
-        request_string += "\r\n"
+        request = (b"GET " + mountpoint.encode('ascii') + b" HTTP/1.1\r\n"
+                   b"User-Agent: " + NTRIP_USER_AGENT.encode('ascii') + b"\r\n"
+                   b"Authorization: Basic " + self.auth_b64 + b"\r\n"
+                   b"Host: " + f"{self.config['caster']}:{self.config['port']}".encode('ascii') + b"\r\n"
+                   b"\r\n")
         
         if self.verbose:
-            logger.debug(f"NTRIP Request:\n{request_string}")
+            logger.debug("NTRIP Request:\n%s", request.decode('ascii'))
         
-        return bytes(request_string, 'ascii')
+        return request
     
-    def _get_gga_data(self) -> Optional[bytes]:
-        try:
-            if self.gga_callback:
+    def _get_gga_data(self) -> bytes:
+        # Resolved on every send - the GPS may not have a fix yet, or the callback
+        # may fail; either way the caster still gets the dummy position
+        if self.gga_callback:
+            try:
                 gga_data = self.gga_callback()
                 if gga_data:
                     return gga_data
-        except Exception as e:
-            logger.warning(f"Failed to get GGA from callback: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to get GGA from callback: {e}")
         
-        # Fallback to dummy GGA
-        dummy_gga = build_dummy_gga()
-        return dummy_gga.encode('utf-8')
+        # Fallback to dummy GGA - only its embedded time changes, so rebuild once per second
+        now = int(time.time())
+        if now != self._dummy_gga_second:
+            self._dummy_gga_second = now
+            self._cached_dummy_gga = build_dummy_gga_bytes(now)
+        return self._cached_dummy_gga
     
     def connect(self) -> bool:
         with self._lock:
@@ -108,18 +178,16 @@ class NTRIPClient:
                 logger.info(f"Connecting to NTRIP caster {self.config['caster']}:{self.config['port']} "
                            f"(attempt {self.connection_attempts})")
                 
-                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                self.socket.settimeout(NTRIP_CONNECTION_TIMEOUT)
+                self.socket = self._open_socket()
+                # GGA goes out as its own small segment right away instead of waiting on Nagle
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._enable_keepalive()
                 
                 if self.use_ssl:
-                    self.socket = ssl.wrap_socket(self.socket)
-                
-                error_indicator = self.socket.connect_ex((self.config["caster"], self.config["port"]))
-                if error_indicator != 0:
-                    raise NTRIPConnectionError(f"Socket connection failed with error: {error_indicator}")
+                    self.socket = self._ssl_context.wrap_socket(
+                        self.socket, server_hostname=self.config["caster"])
                 
-                request = self._build_request()
-                self.socket.sendall(request)
+                self.socket.sendall(self._request_bytes)
                 
                 if self._process_response():
                     self.connected = True
@@ -127,53 +195,91 @@ class NTRIPClient:
                     self._send_initial_gga()
                     return True
                 else:
-                    self._cleanup_socket()
+                    self._cleanup_socket_locked()
                     return False
                 
             except Exception as e:
                 logger.error(f"NTRIP connection error: {e}")
-                self._cleanup_socket()
+                self._cleanup_socket_locked()
                 return False
     
+    def _open_socket(self) -> socket.socket:
+        # Resolves the caster and tries each IPv4/IPv6 address in turn, like
+        # socket.create_connection() - but that only returns the socket after the
+        # handshake, and Linux fixes the window scale at SYN time
+        address = (self.config["caster"], self.config["port"])
+        last_error: Optional[OSError] = None
+        for family, sock_type, proto, _, sockaddr in socket.getaddrinfo(*address, type=socket.SOCK_STREAM):
+            sock = socket.socket(family, sock_type, proto)
+            try:
+                # Larger kernel buffer lets bursts of RTCM frames coalesce into one recv;
+                # set before connect so the full window can be advertised
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, NTRIP_SOCKET_RCVBUF)
+                sock.settimeout(NTRIP_CONNECTION_TIMEOUT)
+                sock.connect(sockaddr)
+                return sock
+            except OSError as e:
+                sock.close()
+                last_error = e
+        raise last_error or NTRIPConnectionError(f"No address found for {address[0]}")
+    
+    def _enable_keepalive(self):
+        # Let the kernel detect a dead caster instead of waiting on recv timeouts
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux-only tuning
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, NTRIP_KEEPALIVE_IDLE)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, NTRIP_KEEPALIVE_INTERVAL)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, NTRIP_KEEPALIVE_COUNT)
+        if hasattr(socket, 'TCP_USER_TIMEOUT'):
+            # Unacknowledged GGA sends fail instead of sitting in the send queue
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, NTRIP_USER_TIMEOUT_MS)
+    
     def _process_response(self) -> bool:
-        found_header = False
-        connection_accepted = False
+        response = self._hdr_buf
+        filled = 0
         
         try:
-            while not found_header:
-                caster_response = self.socket.recv(NTRIP_RESPONSE_BUFFER_SIZE)
-                if not caster_response:
+            # Accumulate until the header is complete - TCP may split it across segments
+            while True:
+                if filled == NTRIP_MAX_HEADER_SIZE:
+                    raise NTRIPConnectionError("NTRIP response header too long")
+                received = self.socket.recv_into(self._hdr_view[filled:])
+                if not received:
                     raise NTRIPConnectionError("No response from NTRIP caster")
+                filled += received
                 
-                response_text = caster_response.decode('utf-8', errors='ignore')
-                header_lines = response_text.split("\r\n")
+                status_end = response.find(b"\r\n", 0, filled)
+                if status_end == -1:
+                    continue
+                status_line = bytes(response[:status_end])
                 
-                for line in header_lines:
-                    line = line.strip()
-                    
-                    if self.verbose and line:
-                        logger.debug(f"NTRIP header: {line}")
-                    
-                    if line == "":
-                        found_header = True
-                        if self.verbose:
-                            logger.debug("End of NTRIP headers")
-                        break
-                    
-                    if "SOURCETABLE" in line:
+                # The status line decides the outcome; only a 200 needs the rest of the header
+                if not status_line.startswith(NTRIP_ACCEPT_STATUS):
+                    if status_line.startswith(b"SOURCETABLE"):
                         raise NTRIPConnectionError("Mount point does not exist - received source table")
-                    elif "401 Unauthorized" in line:
-                        raise NTRIPAuthenticationError("Unauthorized - check username/password")
-                    elif "404 Not Found" in line:
-                        raise NTRIPConnectionError("Mount point not found")
-                    elif any(ok_response in line for ok_response in ["ICY 200 OK", "HTTP/1.0 200 OK", "HTTP/1.1 200 OK"]):
-                        connection_accepted = True
-                        if self.verbose:
-                            logger.debug(f"NTRIP connection accepted: {line}")
+                    status_fields = status_line.split(b" ", 2)
+                    status_code = status_fields[1] if len(status_fields) > 1 else b""
+                    error_class, message = NTRIP_STATUS_ERRORS.get(
+                        status_code, (NTRIPConnectionError, "No valid acceptance response received"))
+                    raise error_class(message)
+                
+                if status_line.startswith(b"ICY"):
+                    # NTRIP v1 casters may start streaming right after the status line
+                    header_end = status_end + 2
+                    break
+                header_end = response.find(b"\r\n\r\n", 0, filled)
+                if header_end != -1:
+                    header_end += 4
+                    break
             
-            if not connection_accepted:
-                raise NTRIPConnectionError("No valid acceptance response received")
+            if self.verbose:
+                for line in response[:header_end].splitlines():
+                    if line:
+                        logger.debug("NTRIP header: %s", line.decode('utf-8', errors='ignore'))
+                logger.debug("NTRIP connection accepted: %s", status_line.decode('ascii', errors='ignore'))
             
+            # Corrections that arrived in the same segment as the header
+            self._pending_data = bytes(response[header_end:filled])
             return True
             
         except Exception as e:
@@ -182,11 +288,9 @@ class NTRIPClient:
     
     def _send_initial_gga(self):
         try:
-            gga_data = self._get_gga_data()
-            if gga_data:
-                self.socket.sendall(gga_data)
-                if self.verbose:
-                    logger.debug("Initial GGA sent to NTRIP caster")
+            self.socket.sendall(self._get_gga_data())
+            if self.verbose:
+                logger.debug("Initial GGA sent to NTRIP caster")
         except Exception as e:
             logger.warning(f"Failed to send initial GGA: {e}")
     
@@ -200,6 +304,10 @@ class NTRIPClient:
             return True
         
         self.running = True
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
         self._data_thread = threading.Thread(
             target=self._data_reception_loop, 
             args=(data_callback,), 
@@ -209,61 +317,139 @@ class NTRIPClient:
         self._data_thread.start()
         return True
     
+    def _register_socket(self):
+        self.socket.settimeout(NTRIP_DATA_TIMEOUT)
+        self._selector.register(self.socket, selectors.EVENT_READ)
+    
+    def _wait_readable(self, timeout: float) -> bool:
+        """Block until the socket is readable, the timeout passes or disconnect() wakes us"""
+        if self.use_ssl and self.socket.pending():
+            return True  # Decrypted bytes already buffered inside the SSL object
+        
+        readable = False
+        for key, _ in self._selector.select(timeout):
+            if key.fd == self._wake_r:
+                os.read(self._wake_r, 64)
+            else:
+                readable = True
+        return readable
+    
     def _data_reception_loop(self, data_callback: Callable[[bytes], None]):
+        try:
+            self._register_socket()
+            self._receive_until_stopped(data_callback)
+        finally:
+            with self._lock:
+                self._selector.close()
+                os.close(self._wake_r)
+                os.close(self._wake_w)
+                self._selector = None
+                self._wake_r = self._wake_w = None
+        
+        logger.info("NTRIP data reception loop ended")
+        self.running = False
+    
+    def _process_data(self, data: bytes, data_callback: Callable[[bytes], None]) -> bool:
+        """Classify a received chunk and forward parsed RTCM frames. Returns False for NMEA."""
+        # The first byte settles the common cases; a chunk continuing a frame the
+        # parser is still assembling is RTCM whatever it starts with
+        first = data[0]
+        if first == 0xD3 or self.rtcm_parser.buffer:
+            data_type = 'rtcm'
+        elif first == 0x24:  # '$'
+            data_type = 'nmea'
+        else:
+            data_type = self.rtcm_validator.detect_data_type(data)
+        
+        if data_type == 'nmea':
+            text = str(data[:100], 'ascii', 'ignore').strip()
+            logger.error("❌ CRITICAL: NTRIP Mount Point '%s' sending NMEA instead of RTCM!", self.config.get('mountpoint', 'unknown'))
+            logger.error("   Received NMEA: %s...", text)
+            logger.error("   🔧 FIX: Change mount point to one that provides RTCM corrections")
+            logger.error("   📡 Suggested mount points: NEAR, POZN, WROC (for Poland)")
+            return False
+        
+        elif data_type == 'rtcm':
+           # logger.info(f"🔧 Processing RTCM data: {len(data)} bytes")
+            
+            rtcm_messages = self.rtcm_parser.add_data(data)
+
+            if rtcm_messages:
+               # logger.info(f"📦 Parsed {len(rtcm_messages)} RTCM messages")
+                
+                for message in rtcm_messages:
+                    if message.is_valid:
+                        #logger.info(f"✅ Forwarding RTCM {message.message_type}: {len(message.raw_message)} bytes")
+                        data_callback(message.raw_message)
+                    else:
+                        logger.warning("❌ Dropped RTCM type %d: CRC invalid (len=%d)",
+                                       message.message_type, message.length)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("⚠️  Unknown data type from NTRIP. First 20 bytes: %s", bytes(data[:20]).hex(' '))
+        return True
+    
+    def _flush_pending_data(self, data_callback: Callable[[bytes], None]):
+        # Corrections that arrived together with the caster's response header
+        if self._pending_data:
+            pending, self._pending_data = self._pending_data, b''
+            self.bytes_received += len(pending)
+            self._process_data(pending, data_callback)
+    
+    def _receive_until_stopped(self, data_callback: Callable[[bytes], None]):
         reconnect_attempts = 0
-        last_gga_time = 0
-        gga_interval = 1.0
+        gga_interval = NTRIP_GGA_INTERVAL
+        # The caller uploads on its own ~1 s schedule with polling jitter; only
+        # fill in once it has clearly gone quiet, or the fallback position gets
+        # interleaved with the real one
+        caller_grace = 2 * gga_interval
+        self._flush_pending_data(data_callback)
+        
+        # Bound once - these are looked up for every received chunk
+        monotonic = time.monotonic
+        wait_readable = self._wait_readable
+        process_data = self._process_data
+        recv_into = self.socket.recv_into
+        rx_buf = self._rx_buf
+        rx_view = self._rx_view
+        
+        # One clock read per wakeup, taken right after the wait, serves both the
+        # GGA schedule and the last-data timestamp
+        now = monotonic()
+        next_gga_deadline = now + gga_interval
         
         while self.running and reconnect_attempts < NTRIP_MAX_RECONNECT_ATTEMPTS:
-            try:                
-                if self.socket:
-                    self.socket.settimeout(NTRIP_DATA_TIMEOUT)
+            try:
+                # A failed reconnect leaves no socket - the selector would then only
+                # watch the wake pipe, so go back through backoff and retry instead
+                if self.socket is None or not self.connected:
+                    raise NTRIPConnectionError("Not connected to NTRIP caster")
 
-                data = self.socket.recv(NTRIP_RESPONSE_BUFFER_SIZE)
+                # The GGA schedule doubles as the selector timeout, so RTCM
+                # packets don't each pay for a clock compare
+                if now >= next_gga_deadline:
+                    if now - self._last_gga_sent >= caller_grace:
+                        self._send_periodic_gga()
+                        next_gga_deadline = now + gga_interval
+                    else:
+                        # The caller's send_gga() is keeping the caster updated
+                        next_gga_deadline = self._last_gga_sent + caller_grace
                 
-                if data:
-                    self.bytes_received += len(data)
-                    self.last_data_time = time.time()
-                    
-                    data_type = self.rtcm_validator.detect_data_type(data)
-                    
-                    if data_type == 'nmea':
-                        text = data.decode('ascii', errors='ignore').strip()
-                        logger.error(f"❌ CRITICAL: NTRIP Mount Point '{self.config.get('mountpoint', 'unknown')}' sending NMEA instead of RTCM!")
-                        logger.error(f"   Received NMEA: {text[:100]}...")
-                        logger.error(f"   🔧 FIX: Change mount point to one that provides RTCM corrections")
-                        logger.error(f"   📡 Suggested mount points: NEAR, POZN, WROC (for Poland)")
-                        continue
-                    
-                    elif data_type == 'rtcm':
-                       # logger.info(f"🔧 Processing RTCM data: {len(data)} bytes")
-                        
-                        rtcm_messages = self.rtcm_parser.add_data(data)
+                readable = wait_readable(next_gga_deadline - now)
+                now = monotonic()
+                if not readable:
+                    continue
 
-                        if rtcm_messages:
-                           # logger.info(f"📦 Parsed {len(rtcm_messages)} RTCM messages")
-                            
-                            for message in rtcm_messages:
-                                if message.is_valid:
-                                    #logger.info(f"✅ Forwarding RTCM {message.message_type}: {len(message.raw_message)} bytes")
-                                    data_callback(message.raw_message)
-
-                                    msg_name = self.rtcm_parser.rtcm_message_types.get(
-                                        message.message_type, f"Type {message.message_type}"
-                                    )
-                                    #logger.debug(f"📡 RTCM {message.message_type} ({msg_name}): {len(message.raw_message)} bytes → GPS")
-                                else:
-                                    logger.warning(
-                                        f"❌ Dropped RTCM type {message.message_type}: CRC invalid (len={message.length})"
-                                    )
-                    else:
-                        hex_preview = ' '.join([f'{b:02x}' for b in data[:20]])
-                        logger.debug(f"⚠️  Unknown data type from NTRIP. First 20 bytes: {hex_preview}")
+                received = recv_into(rx_buf, NTRIP_RESPONSE_BUFFER_SIZE)
+                
+                if received:
+                    # View is only valid until the next recv_into - consumers copy what they keep
+                    data = rx_view[:received]
+                    self.bytes_received += received
+                    self.recv_calls += 1
+                    self._last_data_mono = now
                     
-                    current_time = time.time()
-                    if current_time - last_gga_time >= gga_interval:
-                        self._send_periodic_gga()
-                        last_gga_time = current_time
+                    if not process_data(data, data_callback):
+                        continue
                     
                     reconnect_attempts = 0
                 else:
@@ -272,34 +458,43 @@ class NTRIPClient:
                     
             except socket.timeout:
                 logger.debug("NTRIP data timeout - continuing...")
+                now = monotonic()
                 continue
             except Exception as e:
                 logger.error(f"Error in NTRIP data reception: {e}")
                 reconnect_attempts += 1
                 
                 if reconnect_attempts < NTRIP_MAX_RECONNECT_ATTEMPTS:
-                    logger.info(f"Reconnecting to NTRIP... (attempt {reconnect_attempts})")
-                    time.sleep(NTRIP_RECONNECT_INTERVAL * reconnect_attempts)
+                    # Capped exponential backoff with full jitter avoids reconnect storms
+                    # when many rovers lose the caster at the same time
+                    backoff = min(NTRIP_RECONNECT_INTERVAL * (2 ** reconnect_attempts), NTRIP_MAX_RECONNECT_DELAY)
+                    delay = self._rng.uniform(0, backoff)
+                    logger.info(f"Reconnecting to NTRIP in {delay:.1f}s... (attempt {reconnect_attempts})")
+                    time.sleep(delay)
+                    if not self.running:
+                        break
                     
                     if self._reconnect():
                         logger.info("NTRIP reconnection successful")
+                        self._register_socket()
+                        recv_into = self.socket.recv_into
+                        self._flush_pending_data(data_callback)
+                        next_gga_deadline = monotonic() + gga_interval
                         reconnect_attempts = 0
                     else:
                         logger.warning("NTRIP reconnection failed")
+                    now = monotonic()
                 else:
                     logger.error("Max NTRIP reconnection attempts reached")
                     break
-        
-        logger.info("NTRIP data reception loop ended")
-        self.running = False
     
     def _send_periodic_gga(self):
         try:
             gga_data = self._get_gga_data()
-            if gga_data:
+            with self._lock:
                 self.socket.sendall(gga_data)
-                if self.verbose:
-                    logger.debug("Periodic GGA sent to NTRIP caster")
+            if self.verbose:
+                logger.debug("Periodic GGA sent to NTRIP caster")
         except Exception as e:
             logger.warning(f"Failed to send periodic GGA: {e}")
     
@@ -318,6 +513,7 @@ class NTRIPClient:
             
             try:
                 self.socket.sendall(gga_data)
+                self._last_gga_sent = time.monotonic()
                 return True
             except Exception as e:
                 logger.error(f"Failed to send GGA: {e}")
@@ -326,6 +522,9 @@ class NTRIPClient:
     def disconnect(self):
         logger.info("Disconnecting from NTRIP caster...")
         self.running = False
+        with self._lock:
+            if self._wake_w is not None:
+                os.write(self._wake_w, b'\x00')  # Wake the reception thread immediately
         if self._data_thread and self._data_thread.is_alive():
             self._data_thread.join(timeout=2)
         
@@ -334,29 +533,41 @@ class NTRIPClient:
     
     def _cleanup_socket(self):
         with self._lock:
-            self.connected = False
-            if self.socket:
+            self._cleanup_socket_locked()
+    
+    def _cleanup_socket_locked(self):
+        # Caller must hold self._lock
+        self.connected = False
+        if self.socket:
+            if self._selector is not None:
                 try:
-                    self.socket.close()
-                except:
+                    self._selector.unregister(self.socket)
+                except (KeyError, ValueError):
                     pass
-                finally:
-                    self.socket = None
+            try:
+                self.socket.close()
+            except:
+                pass
+            finally:
+                self.socket = None
+    
+    @property
+    def last_data_time(self) -> float:
+        # Wall-clock time of the last received chunk, derived only when asked for
+        if not self._last_data_mono:
+            return 0
+        return time.time() - (time.monotonic() - self._last_data_mono)
     
     def get_statistics(self) -> Dict[str, Any]:
         base_stats = {
             'connected': self.connected,
             'running': self.running,
             'bytes_received': self.bytes_received,
+            'recv_calls': self.recv_calls,
+            'avg_bytes_per_recv': self.bytes_received / self.recv_calls if self.recv_calls else 0.0,
             'connection_attempts': self.connection_attempts,
             'last_data_time': self.last_data_time,
-            'config': {
-                'caster': self.config['caster'],
-                'port': self.config['port'],
-                'mountpoint': self.config['mountpoint'],
-                'username': self.config['username'][:3] + '***' if self.config['username'] else 'None',
-                'ssl': self.use_ssl
-            }
+            'config': dict(self._stats_config)
         }
         
         rtcm_stats = self.rtcm_parser.get_statistics()
@@ -369,5 +580,3 @@ class NTRIPClient:
     
     def is_running(self) -> bool:
         return self.running
-
-NTRIPClient = NTRIPClient
@@ -1,12 +1,64 @@
 import logging
+import re
 import struct
 from typing import Optional, Dict, Any, List, Tuple
+from collections import defaultdict
 from dataclasses import dataclass
+from types import MappingProxyType
+from .jit_crc import build_crc24q_tables, crc24q as jit_crc24q, scan_rtcm_frames
 
 logger = logging.getLogger(__name__)
 
+# Enough leading bytes to hold one full NMEA sentence (max 82 chars)
+NMEA_SNIFF_LENGTH = 96
+
+_U16BE = struct.Struct('>H')
+
+# Matched against raw bytes - no decode of the received chunk
+_NMEA_START_RE = re.compile(rb'\s*\$')
+_NMEA_SENTENCE_RE = re.compile(rb'\s*\$[A-Z]{2}(?:GGA|RMC|GSV|GLL|VTG)')
+
+RTCM_MAX_FRAME_SIZE = 3 + 1023 + 3  # Header + max payload + CRC
+RTCM_MAX_BUFFER_SIZE = 65536
+
+# Shared, read-only name table for known message types
+RTCM_MESSAGE_TYPES = MappingProxyType({
+    1001: "GPS L1 Code Observations",
+    1002: "GPS L1 Phase Observations",
+    1003: "GPS L1 Code & Phase Observations",
+    1004: "GPS L1 Code & Phase Observations (Extended)",
+    1005: "RTK Base Station ARP Coordinates",
+    1006: "RTK Base Station ARP Coordinates with Height",
+    1007: "Antenna Descriptor",
+    1008: "Antenna Descriptor & Serial Number",
+    1009: "GLONASS L1 Code Observations",
+    1010: "GLONASS L1 Phase Observations",
+    1011: "GLONASS L1 Code & Phase Observations",
+    1012: "GLONASS L1 Code & Phase Observations (Extended)",
+    1019: "GPS Ephemeris",
+    1020: "GLONASS Ephemeris",
+    1033: "Receiver and Antenna Descriptors",
+    1074: "GPS MSM4",
+    1075: "GPS MSM5",
+    1077: "GPS MSM7",
+    1084: "GLONASS MSM4",
+    1085: "GLONASS MSM5",
+    1087: "GLONASS MSM7",
+    1094: "Galileo MSM4",
+    1095: "Galileo MSM5",
+    1097: "Galileo MSM7",
+    1124: "BeiDou MSM4",
+    1125: "BeiDou MSM5",
+    1127: "BeiDou MSM7",
+    1230: "GLONASS Code-Phase Biases",
+    4094: "Proprietary (4094)"
+})
+
 @dataclass
 class RTCMMessage:
+    # Spelled out rather than slots=True so older Raspberry Pi OS Pythons still work
+    __slots__ = ('message_type', 'length', 'data', 'crc', 'raw_message', 'is_valid')
+    
     message_type: int
     length: int
     data: bytes
@@ -25,201 +77,198 @@ class RTCMParser:
     - Message Type: 12 bits
     - Message Data: Variable length
     - CRC: 24 bits
+    
+    After a frame fails its CRC, strict_resync=True resumes the preamble search
+    one byte later so a real frame hidden inside the bad one is not missed.
+    strict_resync=False jumps over the whole claimed frame instead, which
+    resyncs faster on noisy links full of 0xD3 bytes but can lose the frame
+    after a corrupted length field.
     """
     
-    def __init__(self):
+    # Byte-wise CRC-24Q table; a tuple indexes faster than a list
+    _CRC24Q_TABLE = tuple(build_crc24q_tables(1)[0])
+    rtcm_message_types = RTCM_MESSAGE_TYPES
+    
+    def __init__(self, strict_resync: bool = True):
         self.buffer = bytearray()
+        self.strict_resync = strict_resync
         self.stats = {
             'messages_parsed': 0,
             'parse_errors': 0,
             'crc_errors': 0,
             'unknown_messages': 0,
-            'message_types': {}
-        }
-        self.rtcm_message_types = {
-            1001: "GPS L1 Code Observations",
-            1002: "GPS L1 Phase Observations", 
-            1003: "GPS L1 Code & Phase Observations",
-            1004: "GPS L1 Code & Phase Observations (Extended)",
-            1005: "RTK Base Station ARP Coordinates",
-            1006: "RTK Base Station ARP Coordinates with Height",
-            1007: "Antenna Descriptor",
-            1008: "Antenna Descriptor & Serial Number",
-            1009: "GLONASS L1 Code Observations",
-            1010: "GLONASS L1 Phase Observations",
-            1011: "GLONASS L1 Code & Phase Observations",
-            1012: "GLONASS L1 Code & Phase Observations (Extended)",
-            1019: "GPS Ephemeris",
-            1020: "GLONASS Ephemeris",
-            1033: "Receiver and Antenna Descriptors",
-            1074: "GPS MSM4",
-            1075: "GPS MSM5",
-            1077: "GPS MSM7",
-            1084: "GLONASS MSM4",
-            1085: "GLONASS MSM5",
-            1087: "GLONASS MSM7",
-            1094: "Galileo MSM4",
-            1095: "Galileo MSM5",
-            1097: "Galileo MSM7",
-            1124: "BeiDou MSM4",
-            1125: "BeiDou MSM5",
-            1127: "BeiDou MSM7",
-            1230: "GLONASS Code-Phase Biases",
-            4094: "Proprietary (4094)"
+            'message_types': defaultdict(int)
         }
+        # Bumped whenever counters or the buffer change; get_statistics() reuses
+        # its last snapshot while this stays the same
+        self._stats_version = 0
+        self._stats_cache_version = -1
+        self._stats_cache: Dict[str, Any] = {}
     
     def add_data(self, data: bytes) -> List[RTCMMessage]:
+        # Accepts any bytes-like object; a memoryview over the receive buffer is copied here once
+        self._stats_version += 1
+        if not self.buffer and len(data) > 6 and data[0] == 0xD3 \
+                and 6 + (((data[1] & 0x03) << 8) | data[2]) == len(data):
+            # Chunk is exactly one frame - parse it without buffering. The copy is the
+            # one _finish_message would make anyway (slicing all of a bytes is free)
+            frame = bytes(data)
+            length = len(frame) - 6
+            if self._validate_crc(frame[:-3], int.from_bytes(frame[-3:], 'big')):
+                return [self._finish_message(frame, 0, length, True)]
+            # Bad CRC - let the buffered path resync one byte on, as strict_resync promises
+        
         self.buffer.extend(data)
-        return self._extract_messages()
+        messages = self._extract_messages()
+        # Capped only after extraction - a full 64 KiB recv behind a partial frame
+        # is mostly complete frames. What is left is the start of one frame at most,
+        # so this only trips if that invariant is ever broken.
+        if len(self.buffer) > RTCM_MAX_BUFFER_SIZE:
+            logger.warning("RTCM buffer over %d bytes, keeping last %d", RTCM_MAX_BUFFER_SIZE, RTCM_MAX_FRAME_SIZE)
+            del self.buffer[:-RTCM_MAX_FRAME_SIZE]
+        return messages
     
     def _extract_messages(self) -> List[RTCMMessage]:
+        if scan_rtcm_frames is not None:
+            return self._extract_messages_compiled()
+        
         messages = []
-        max_iterations = 10
-        iterations = 0
+        buffer = self.buffer
+        # Consumed bytes are dropped once at the end instead of re-slicing per frame
+        head = 0
         
-        while len(self.buffer) >= 1 and iterations < max_iterations:
-            iterations += 1
-            
-            preamble_idx = self._find_preamble()
+        # Drain everything available - a burst can carry many frames at once
+        while head < len(buffer):
+            preamble_idx = self._find_preamble(head)
             
             if preamble_idx == -1:
-                if len(self.buffer) > 1000:
-                    self.buffer = self.buffer[-100:]
-                    logger.warning(f"Buffer too large ({len(self.buffer)} bytes), truncated")
+                # No frame can start in what is left - drop it all
+                logger.debug("Discarded %d bytes without RTCM preamble", len(buffer) - head)
+                head = len(buffer)
                 break
 
-            if preamble_idx > 0:
-                discarded = self.buffer[:preamble_idx]
-                self.buffer = self.buffer[preamble_idx:]
-                logger.debug(f"Discarded {len(discarded)} bytes before RTCM preamble")
+            if preamble_idx > head:
+                logger.debug("Discarded %d bytes before RTCM preamble", preamble_idx - head)
+                head = preamble_idx
 
-            if len(self.buffer) < 3:
+            if len(buffer) - head < 3:
                 break
-            try:
-                header = struct.unpack('>I', b'\x00' + self.buffer[0:3])[0]
-                length = header & 0x3FF
-                total_length = 3 + length + 3
-                if length <= 0 or length > 1023:
-                    self.buffer = self.buffer[1:]
-                    continue
-                if len(self.buffer) < total_length:
-                    break
-            except Exception:
+            length = ((buffer[head + 1] & 0x03) << 8) | buffer[head + 2]
+            if length == 0:
+                head += 1
+                continue
+            total_length = 3 + length + 3  # Header + Data + CRC
+            if len(buffer) - head < total_length:
                 break
             
-            message = self._parse_message()
+            # Header is already decoded - only the payload and CRC are left to check
+            message = self._finish_message(buffer, head, length)
             
             if message:
                 messages.append(message)
-                self.buffer = self.buffer[len(message.raw_message):]
+                head += total_length
+            elif self.strict_resync:
+                head += 1
             else:
-                self.buffer = self.buffer[1:]
+                head += total_length
         
+        if head:
+            del buffer[:head]
+        return messages
+    
+    def _extract_messages_compiled(self) -> List[RTCMMessage]:
+        buffer = self.buffer
+        frames, consumed, discarded = scan_rtcm_frames(buffer, self.strict_resync)
+        if discarded:
+            logger.debug("Discarded %d bytes without RTCM preamble", discarded)
+        
+        messages = []
+        for offset, length, crc_ok in frames:
+            message = self._finish_message(buffer, offset, length, crc_ok)
+            if message:
+                messages.append(message)
+        
+        if consumed:
+            del buffer[:consumed]
         return messages
     
     def reset(self):
         logger.info("🔄 Resetting RTCM parser - clearing all buffers")
         self.buffer = bytearray()
         self.incomplete_message = None
+        self._stats_version += 1
         # Reset any internal state if needed
     
-    def _find_preamble(self) -> int:
-        for i in range(len(self.buffer)):
-            if self.buffer[i] == 0xD3:
-                return i
-        return -1
+    def _find_preamble(self, start: int = 0) -> int:
+        return self.buffer.find(0xD3, start)  # memchr in C
     
-    def _parse_message(self) -> Optional[RTCMMessage]:
-        if len(self.buffer) < 6:
-            return None
-        
-        try:
-            if self.buffer[0] != 0xD3:
-                logger.warning("Invalid RTCM preamble")
-                self.stats['parse_errors'] += 1
-                return None
-            
-            header = struct.unpack('>I', b'\x00' + self.buffer[0:3])[0]
-            
-            preamble = (header >> 16) & 0xFF  # Should be 0xD3
-            reserved = (header >> 10) & 0x3F  # Should be 0
-            length = header & 0x3FF  # Message length (0-1023)
-            
-            if preamble != 0xD3:
-                logger.warning(f"Invalid preamble: 0x{preamble:02X}")
-                self.stats['parse_errors'] += 1
-                return None
-            
-            if reserved != 0:
-                logger.warning(f"Invalid reserved field: {reserved}")
-            
-            total_length = 3 + length + 3  # Header + Data + CRC
-            if len(self.buffer) < total_length:
-                return None  # Wait for more data
-            
-            message_data = self.buffer[3:3+length]
-            crc_bytes = self.buffer[3+length:3+length+3]
-            crc = struct.unpack('>I', b'\x00' + crc_bytes)[0]
-            
-            if length >= 2:
-                msg_type = struct.unpack('>H', message_data[0:2])[0] >> 4
-            else:
-                msg_type = 0
-            
-            raw_message = bytes(self.buffer[0:total_length])
+    def _finish_message(self, buf, start: int, length: int, crc_ok: bool = False) -> Optional[RTCMMessage]:
+        """
+        Build a message from a frame whose preamble and length the caller already checked
 
-            is_valid = self._validate_crc(raw_message[:-3], crc)
-            if not is_valid:
-                self.stats['crc_errors'] += 1
-                logger.warning(f"Invalid CRC for RTCM message type {msg_type} (len={length})")
-                return None
+        crc_ok skips the CRC check when the compiled scanner has already done it.
+        """
+        reserved = buf[start + 1] >> 2  # Should be 0
+        if reserved != 0:
+            logger.warning("Invalid reserved field: %d", reserved)
+        
+        # Copy out first - buf may be a view over a reused receive buffer
+        raw_message = bytes(buf[start:start + length + 6])
+        message_data = raw_message[3:3+length]
+        crc = int.from_bytes(raw_message[3+length:3+length+3], 'big')
+        
+        if length >= 2:
+            msg_type = _U16BE.unpack_from(raw_message, 3)[0] >> 4
+        else:
+            msg_type = 0
 
-            self.stats['messages_parsed'] += 1
-            if msg_type in self.stats['message_types']:
-                self.stats['message_types'][msg_type] += 1
-            else:
-                self.stats['message_types'][msg_type] = 1
+        is_valid = crc_ok or self._validate_crc(raw_message[:-3], crc)
+        if not is_valid:
+            self.stats['crc_errors'] += 1
+            logger.warning("Invalid CRC for RTCM message type %d (len=%d)", msg_type, length)
+            return None
 
-            msg_name = self.rtcm_message_types.get(msg_type, f"Unknown ({msg_type})")
-            if msg_type not in self.rtcm_message_types:
-                self.stats['unknown_messages'] += 1
+        self.stats['messages_parsed'] += 1
+        self.stats['message_types'][msg_type] += 1
 
-#            logger.debug(f"📡 RTCM Message: Type {msg_type} ({msg_name}), Length: {length}, Valid: {is_valid}")
-            return RTCMMessage(
-                message_type=msg_type,
-                length=length,
-                data=message_data,
-                crc=crc,
-                raw_message=raw_message,
-                is_valid=is_valid
-            )
+        if msg_type not in RTCM_MESSAGE_TYPES:
+            self.stats['unknown_messages'] += 1
 
-        except Exception as e:
-            logger.error(f"Error parsing RTCM message: {e}")
-            self.stats['parse_errors'] += 1
-            return None
+        return RTCMMessage(
+            message_type=msg_type,
+            length=length,
+            data=message_data,
+            crc=crc,
+            raw_message=raw_message,
+            is_valid=is_valid
+        )
 
     def _validate_crc(self, data: bytes, received_crc: int) -> bool:
+        if jit_crc24q is not None:
+            return jit_crc24q(data) == received_crc
+        
         crc = 0
+        table = self._CRC24Q_TABLE
         for byte in data:
-            crc ^= byte << 16
-            for _ in range(8):
-                if crc & 0x800000:
-                    crc = (crc << 1) ^ 0x1864CFB
-                else:
-                    crc <<= 1
-        crc &= 0xFFFFFF
+            crc = ((crc << 8) & 0xFFFFFF) ^ table[(crc >> 16) ^ byte]
         return crc == received_crc
     
     def get_statistics(self) -> Dict[str, Any]:
-        return {
-            'total_parsed': self.stats['messages_parsed'],
-            'parse_errors': self.stats['parse_errors'],
-            'crc_errors': self.stats['crc_errors'],
-            'unknown_messages': self.stats['unknown_messages'],
-            'message_types': self.stats['message_types'].copy(),
-            'buffer_size': len(self.buffer)
-        }
+        if self._stats_cache_version != self._stats_version:
+            self._stats_cache = {
+                'total_parsed': self.stats['messages_parsed'],
+                'parse_errors': self.stats['parse_errors'],
+                'crc_errors': self.stats['crc_errors'],
+                'unknown_messages': self.stats['unknown_messages'],
+                'message_types': dict(self.stats['message_types']),
+                'buffer_size': len(self.buffer)
+            }
+            self._stats_cache_version = self._stats_version
+        # Each caller gets its own copy - the report is merged into other stats
+        # and read from several threads
+        stats = dict(self._stats_cache)
+        stats['message_types'] = dict(stats['message_types'])
+        return stats
     
     def reset_statistics(self):
         self.stats = {
@@ -227,11 +276,13 @@ class RTCMParser:
             'parse_errors': 0,
             'crc_errors': 0,
             'unknown_messages': 0,
-            'message_types': {}
+            'message_types': defaultdict(int)
         }
+        self._stats_version += 1
     
     def clear_buffer(self):
         self.buffer.clear()
+        self._stats_version += 1
 
 
 class RTCMValidator:
@@ -241,7 +292,7 @@ class RTCMValidator:
         Quick check if data contains RTCM messages
         
         Args:
-            data: Raw bytes to check
+            data: Raw bytes (or any bytes-like object) to check
             
         Returns:
             True if data appears to be RTCM, False otherwise
@@ -249,41 +300,24 @@ class RTCMValidator:
         if not data or len(data) < 3:
             return False
         
-        try:
-            text = data.decode('ascii', errors='ignore').strip()
-            if text.startswith('$') and any(msg_type in text for msg_type in ['GGA', 'RMC', 'GSV', 'GLL', 'VTG']):
-                logger.error(f"NMEA data detected instead of RTCM: {text[:80]}...")
-                return False
-        except:
-            pass
+        if _NMEA_SENTENCE_RE.match(data[:NMEA_SNIFF_LENGTH]):
+            logger.error("NMEA data detected instead of RTCM: %s...",
+                         str(data[:80], 'ascii', 'ignore').strip())
+            return False
         
+        # Look for a preamble with a plausible length in the first 50 bytes;
+        # find() runs in C (memchr) instead of a per-byte Python loop
+        head = bytes(data[:52])
+        search_end = len(head) - 2
         rtcm_found = False
-        for i in range(min(50, len(data) - 2)):
-            if data[i] == 0xD3:
-                if len(data) >= i + 3:
-                    try:
-                        header = struct.unpack('>I', b'\x00' + data[i:i+3])[0]
-                        length = header & 0x3FF
-                        if 0 < length < 1024:
-                            rtcm_found = True
-                            break
-                    except:
-                        continue
-
-        if not rtcm_found:
-            if len(data) > 20:
-                repeating_bytes = sum(1 for i in range(1, min(20, len(data))) if data[i] == data[i-1])
-                repeating_ratio = repeating_bytes / min(20, len(data))
+        i = head.find(b'\xD3', 0, search_end)
+        while i != -1:
+            length = ((head[i + 1] & 0x03) << 8) | head[i + 2]
+            if 0 < length < 1024:
+                rtcm_found = True
+                break
+            i = head.find(b'\xD3', i + 1, search_end)
 
-                if repeating_ratio > 0.5:
-                    logger.debug(f"Rejected data: too many repeating bytes ({repeating_ratio:.1%})")
-                    return False
-                
-                # Check for all-zero or all-0xFF patterns
-                if all(b == 0x00 for b in data[:10]) or all(b == 0xFF for b in data[:10]):
-                    logger.debug("Rejected data: all zeros or all 0xFF")
-                    return False
-        
         return rtcm_found
     
     @staticmethod
@@ -291,12 +325,8 @@ class RTCMValidator:
         if not data:
             return 'unknown'
         
-        try:
-            text = data.decode('ascii', errors='ignore').strip()
-            if text.startswith('$'):
-                return 'nmea'
-        except:
-            pass
+        if _NMEA_START_RE.match(data[:NMEA_SNIFF_LENGTH]):
+            return 'nmea'
         
         if RTCMValidator.is_rtcm_data(data):
             return 'rtcm'
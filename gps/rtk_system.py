@@ -10,6 +10,14 @@ from .core.interfaces import (
 
 logger = logging.getLogger(__name__)
 
+RTCM_POLL_INTERVAL = 0.1         # seconds between RTCM forwarding passes
+GGA_UPLOAD_INTERVAL = 1.0        # seconds between GGA uploads to the caster
+NTRIP_LINK_CHECK_INTERVAL = 10.0
+NTRIP_STATUS_LOG_INTERVAL = 60.0
+
+# time, lat ddmm.mmmm, N/S, lon dddmm.mmmm, E/W, satellites, HDOP, altitude
+_GGA_FORMAT = "$GNGGA,%s,%02d%07.4f,%s,%03d%07.4f,%s,1,%d,%.1f,%.1f,M,0.0,M,,*00\r\n"
+
 class RTKSystem(RTKSystemInterface):
     def __init__(self, gps: GPS, ntrip_service: Optional[NTRIPService] = None):
         self.gps = gps
@@ -18,7 +26,7 @@ class RTKSystem(RTKSystemInterface):
         
         self.running = False
         self.current_position: Optional[Position] = None
-        self.rtcm_queue = queue.Queue(maxsize=100)
+        self.position_queue = queue.Queue(maxsize=256)
         
         self._position_lock = threading.Lock()
         self._threads: List[threading.Thread] = []
@@ -26,6 +34,11 @@ class RTKSystem(RTKSystemInterface):
         self._start_time = 0
         self._position_count = 0
         self._last_position_log = 0
+        self._dropped_positions = 0
+        self._last_ntrip_status_log = 0.0
+        # Position the last GGA sentence was built from, and that sentence
+        self._gga_position: Optional[Position] = None
+        self._gga_bytes: Optional[bytes] = None
     
     def start(self) -> bool:
         if self.running:
@@ -39,13 +52,11 @@ class RTKSystem(RTKSystemInterface):
         self._start_time = time.time()
         
         self._start_thread(self._position_loop, "PositionReader")
-        self._start_thread(self._rtcm_writer_loop, "RTCMWriter")
+        self._start_thread(self._position_dispatch_loop, "PositionDispatcher")
         
         if self.ntrip_service:
             if self.ntrip_service.connect():
-                self._start_thread(self._gga_upload_loop, "GGAUploader")
-                self._start_thread(self._ntrip_monitor_loop, "NTRIPMonitor")
-                self._start_thread(self._rtcm_reader_loop, "RTCMReader")
+                self._start_thread(self._ntrip_loop, "NTRIPLink")
                 logger.info("🌐 RTK system started with NTRIP connection")
             else:
                 logger.warning("⚠️ NTRIP connection failed - running in GPS-only mode")
@@ -65,14 +76,37 @@ class RTKSystem(RTKSystemInterface):
             if position:
                 self._update_position(position)
             else:
-                # Prevent busy-waiting on read error
+                # read_position() already blocked on the port - only a timeout or
+                # read error gets here, so just avoid busy-waiting on the latter
                 time.sleep(0.1)
     
     def _update_position(self, position: Position):
         with self._position_lock:
             self.current_position = position
             self._position_count += 1
-            
+        
+        # Hand off to the dispatcher so slow observers never stall serial reads
+        try:
+            self.position_queue.put_nowait(position)
+        except queue.Full:
+            # Observers are lagging - drop the oldest fix so the newest gets through
+            try:
+                self.position_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._dropped_positions += 1
+            logger.warning(f"⚠️ Position queue full, dropped {self._dropped_positions} stale fix(es)")
+            self.position_queue.put_nowait(position)
+    
+    def _position_dispatch_loop(self):
+        while self.running:
+            try:
+                position = self.position_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            self._notify_observers(position)
+    
+    def _notify_observers(self, position: Position):
         # Log position update every 1 second
         current_time = time.time()
         if current_time - self._last_position_log >= 1.0:
@@ -87,82 +121,67 @@ class RTKSystem(RTKSystemInterface):
             except Exception as e:
                 logger.error(f"Observer error: {e}")
     
-    def _rtcm_reader_loop(self):
-        """Read RTCM data from NTRIP service and add to queue"""
-        rtcm_received_count = 0
+    def _ntrip_loop(self):
+        """Forward RTCM to the GPS, upload GGA and watch the NTRIP link"""
+        # One thread instead of four - GGA upload and link checks run off
+        # their own monotonic deadlines between RTCM polls
+        rtcm_count = 0
+        now = time.monotonic()
+        next_gga = next_link_check = now
+        self._last_ntrip_status_log = now - NTRIP_STATUS_LOG_INTERVAL
+        
         while self.running and self.ntrip_service:
             try:
-                rtcm_messages = self.ntrip_service.get_rtcm_data()
-                for rtcm_data in rtcm_messages:
-                    rtcm_received_count += 1
-                    
-                    if not self.rtcm_queue.full():
-                        self.rtcm_queue.put(rtcm_data, block=False)
-                        
+                frames = self.ntrip_service.get_rtcm_data()
+                if frames:
+                    rtcm_count += len(frames)
+                    if self.gps.write_rtcm_batch(frames):
+                        self._stats.rtcm_messages += len(frames)
                     else:
-                        logger.warning(f"⚠️ RTCM queue full, dropping message #{rtcm_received_count}")
-                
-                time.sleep(0.1)  # Check for new RTCM data every 100ms
-            except Exception as e:
-                logger.error(f"RTCM reader error: {e}")
-                time.sleep(1.0)
-
-    def _rtcm_writer_loop(self):
-        rtcm_count = 0
-        while self.running:
-            try:
-                rtcm_data = self.rtcm_queue.get(timeout=1.0)
-                rtcm_count += 1
-                
-                if self.gps.write_rtcm(rtcm_data):
-                    self._stats.rtcm_messages += 1
-                else:
-                    logger.warning(f"❌ RTCM #{rtcm_count}: Failed to write to GPS")
-            except queue.Empty:
-                continue
+                        logger.warning(f"❌ RTCM #{rtcm_count}: Failed to write {len(frames)} frame(s) to GPS")
             except Exception as e:
-                logger.error(f"RTCM write error: {e}")
+                logger.error(f"RTCM forwarding error: {e}")
+            
+            now = time.monotonic()
+            if now >= next_gga:
+                next_gga = now + self._upload_gga()
+            if now >= next_link_check:
+                next_link_check = now + self._check_ntrip_link(now)
+            
+            time.sleep(RTCM_POLL_INTERVAL)
     
-    def _gga_upload_loop(self):
-        upload_count = 0
-        while self.running and self.ntrip_service:
-            try:
-                gga_data = self._build_gga()
-                if gga_data:
-                    upload_count += 1
-                    if not self.ntrip_service.send_gga(gga_data):
-                        logger.warning("Failed to send GGA, backing off for 5s")
-                        time.sleep(5.0)
-                
-                # Wait before sending next GGA
-                time.sleep(1.0)
-            except Exception as e:
-                logger.error(f"GGA upload error: {e}")
-                time.sleep(5.0) # Wait longer on error
+    def _upload_gga(self) -> float:
+        """Send the current position to the caster; returns seconds until the next upload"""
+        try:
+            gga_data = self._build_gga()
+            if gga_data and not self.ntrip_service.send_gga(gga_data):
+                logger.warning("Failed to send GGA, backing off for 5s")
+                return 5.0
+            return GGA_UPLOAD_INTERVAL
+        except Exception as e:
+            logger.error(f"GGA upload error: {e}")
+            return 5.0  # Wait longer on error
     
-    def _ntrip_monitor_loop(self):
-        """Monitor NTRIP connection health"""
-        last_status_log = 0
-        while self.running and self.ntrip_service:
-            try:
-                current_time = time.time()
-                is_connected = self.ntrip_service.is_connected()
-                
-                # Log status every 60 seconds at debug level
-                if current_time - last_status_log >= 60.0:
-                    status = "🌐 CONNECTED" if is_connected else "❌ DISCONNECTED"
-                    logger.debug(f"NTRIP Status: {status}")
-                    last_status_log = current_time
-                
-                # If disconnected, log more frequently
-                if not is_connected and current_time - last_status_log >= 10.0:
-                    logger.warning("⚠️ NTRIP connection lost - auto-reconnect will attempt")
-                    last_status_log = current_time
-                
-                time.sleep(10.0)
-            except Exception as e:
-                logger.error(f"NTRIP monitor error: {e}")
-                time.sleep(30.0)
+    def _check_ntrip_link(self, now: float) -> float:
+        """Log NTRIP connection health; returns seconds until the next check"""
+        try:
+            is_connected = self.ntrip_service.is_connected()
+            
+            # Log status every 60 seconds at debug level
+            if now - self._last_ntrip_status_log >= NTRIP_STATUS_LOG_INTERVAL:
+                status = "🌐 CONNECTED" if is_connected else "❌ DISCONNECTED"
+                logger.debug(f"NTRIP Status: {status}")
+                self._last_ntrip_status_log = now
+            
+            # If disconnected, log more frequently
+            if not is_connected and now - self._last_ntrip_status_log >= NTRIP_LINK_CHECK_INTERVAL:
+                logger.warning("⚠️ NTRIP connection lost - auto-reconnect will attempt")
+                self._last_ntrip_status_log = now
+            
+            return NTRIP_LINK_CHECK_INTERVAL
+        except Exception as e:
+            logger.error(f"NTRIP monitor error: {e}")
+            return 30.0
     
     def _build_gga(self) -> Optional[bytes]:
         with self._position_lock:
@@ -170,22 +189,26 @@ class RTKSystem(RTKSystemInterface):
                 return None
             pos = self.current_position
         
-        lat = abs(pos.lat)
-        lat_deg = int(lat)
-        lat_min = (lat - lat_deg) * 60
+        # Positions are replaced, never mutated - a stalled GPS keeps the same
+        # object, so the sentence built for it last time still holds
+        if pos is self._gga_position:
+            return self._gga_bytes
+        
+        lat_deg, lat_min = divmod(abs(pos.lat) * 60, 60)
         lat_ns = "N" if pos.lat >= 0 else "S"
         
-        lon = abs(pos.lon)
-        lon_deg = int(lon)
-        lon_min = (lon - lon_deg) * 60
+        lon_deg, lon_min = divmod(abs(pos.lon) * 60, 60)
         lon_ew = "E" if pos.lon >= 0 else "W"
         
-        gga = (f"$GNGGA,{time.strftime('%H%M%S')},"
-               f"{lat_deg:02d}{lat_min:07.4f},{lat_ns},"
-               f"{lon_deg:03d}{lon_min:07.4f},{lon_ew},"
-               f"1,{pos.satellites},{pos.hdop:.1f},{pos.altitude:.1f},M,0.0,M,,*00")
+        # UTC time of the fix, taken from its ISO timestamp (YYYY-MM-DDTHH:MM:SSZ)
+        fix_time = pos.timestamp[11:13] + pos.timestamp[14:16] + pos.timestamp[17:19]
+        
+        gga = _GGA_FORMAT % (fix_time, lat_deg, lat_min, lat_ns, lon_deg, lon_min, lon_ew,
+                             pos.satellites, pos.hdop, pos.altitude)
         
-        return gga.encode('ascii')
+        self._gga_position = pos
+        self._gga_bytes = gga.encode('ascii')
+        return self._gga_bytes
     
     def stop(self):
         logger.info("Stopping RTK system")
@@ -5,7 +5,6 @@ import queue
 from typing import List, Optional
 from ..ntrip_client import NTRIPClient
 from ..core.interfaces import NTRIPService
-from config.nmea_utils import build_dummy_gga
 
 logger = logging.getLogger(__name__)
 
@@ -20,17 +19,15 @@ class NTRIPServiceAdapter(NTRIPService):
         
         self._rtcm_queue = queue.Queue(maxsize=100)
         self._lock = threading.Lock()
-        self._dummy_gga_data = build_dummy_gga().encode('ascii')
         
     def connect(self) -> bool:
         if not self.config.get('enabled', False):
             return False
             
         try:
-            self.client = NTRIPClient(
-                config=self.config,
-                gga_callback=self._get_dummy_gga
-            )
+            # No GGA callback - the client falls back to its own per-second dummy GGA
+            # until RTKSystem starts uploading the real position
+            self.client = NTRIPClient(config=self.config)
             
             if self.client.connect():
                 success = self.client.start_data_reception(self._on_rtcm_data)
@@ -57,9 +54,6 @@ class NTRIPServiceAdapter(NTRIPService):
         except Exception as e:
             logger.error(f"Error handling RTCM data: {e}")
     
-    def _get_dummy_gga(self) -> Optional[bytes]:
-        return self._dummy_gga_data
-    
     def send_gga(self, gga_data: bytes) -> bool:
         if not self.client:
             self._attempt_reconnect()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test suite for the compiled RTCM kernels in gps/jit_crc.py
+Only meaningful with numba installed - skipped otherwise:
+1. Slice-by-16 CRC-24Q matches the reference CRC
+2. Compiled frame scan extracts the same messages as the pure-Python loop
+"""
+
+import os
+import random
+import sys
+
+from gps.test_support import crc24q, rtcm_frame, skip_test
+
+
+def test_crc24q_matches_reference():
+    """Compiled CRC-24Q agrees with the bitwise reference, including partial 16-byte blocks"""
+    print("\n=== Test 1: Compiled CRC-24Q ===")
+
+    from gps import jit_crc
+    if not jit_crc.JIT_ENABLED:
+        return skip_test("numba not installed")
+
+    rng = random.Random(3)
+    lengths = list(range(0, 70)) + [rng.randint(70, 1029) for _ in range(50)] + [1029]
+    for length in lengths:
+        data = os.urandom(length)
+        expected = crc24q(data)
+        for buf in (data, bytearray(data), memoryview(data)):
+            got = jit_crc.crc24q(buf)
+            assert got == expected, \
+                f"length {length} ({type(buf).__name__}): {got:06X} != {expected:06X}"
+
+    print(f"✅ Test 1 PASSED: {len(lengths)} lengths match the reference")
+    return True
+
+
+def noisy_stream(rng):
+    """Good frames mixed with junk, stray preambles and corrupted frames"""
+    parts = []
+    for i in range(200):
+        frame = bytearray(rtcm_frame(rng.choice([1005, 1077, 1087, 1230]), rng.randint(2, 300)))
+        kind = i % 6
+        if kind == 1:
+            frame[rng.randrange(3, len(frame) - 3)] ^= 0x5A  # Corrupted payload
+        elif kind == 2:
+            frame[-1] ^= 0x01  # Corrupted CRC
+        elif kind == 3:
+            # Junk with stray preambles, some followed by plausible lengths
+            junk = bytearray(rng.getrandbits(8) for _ in range(rng.randint(1, 40)))
+            for _ in range(3):
+                junk[rng.randrange(len(junk))] = 0xD3
+            parts.append(bytes(junk) + b'\xd3\x00\x00')
+        elif kind == 4:
+            # Corrupted frame whose body hides a good one
+            inner = rtcm_frame(1006)
+            frame = bytearray([0xD3, 0x00, len(inner)]) + inner + b'\x00\x00\x00'
+        parts.append(bytes(frame))
+    parts.append(rtcm_frame(1033)[:10])  # Truncated tail stays buffered
+    return b''.join(parts)
+
+
+def extract_all(stream, chunk_sizes, strict_resync):
+    """Feed the stream in the given chunks and collect what the parser reports"""
+    from gps.rtcm_parser import RTCMParser
+
+    parser = RTCMParser(strict_resync=strict_resync)
+    messages = []
+    pos = 0
+    for size in chunk_sizes:
+        messages += parser.add_data(stream[pos:pos + size])
+        pos += size
+    stats = parser.get_statistics()
+    return ([(m.message_type, m.raw_message) for m in messages],
+            stats['crc_errors'], stats['buffer_size'])
+
+
+def test_compiled_scan_matches_python():
+    """Compiled and pure-Python extraction agree on a noisy stream in both resync modes"""
+    print("\n=== Test 2: Compiled Scan Matches Python ===")
+
+    from gps import jit_crc, rtcm_parser
+    if not jit_crc.JIT_ENABLED:
+        return skip_test("numba not installed")
+
+    rng = random.Random(11)
+    stream = noisy_stream(rng)
+    chunkings = [[len(stream)], []]
+    while sum(chunkings[1]) < len(stream):
+        chunkings[1].append(rng.choice([1, 2, 7, 64, 333, 4096]))
+
+    for strict_resync in (True, False):
+        for chunk_sizes in chunkings:
+            compiled = extract_all(stream, chunk_sizes, strict_resync)
+            rtcm_parser.scan_rtcm_frames = None
+            try:
+                python = extract_all(stream, chunk_sizes, strict_resync)
+            finally:
+                rtcm_parser.scan_rtcm_frames = jit_crc.scan_rtcm_frames
+
+            print(f"  strict={strict_resync}, {len(chunk_sizes)} chunk(s): "
+                  f"{len(python[0])} messages, {python[1]} CRC errors, {python[2]} bytes buffered")
+            assert python[0], "stream produced no messages"
+            assert compiled[0] == python[0], \
+                f"messages differ ({len(compiled[0])} compiled vs {len(python[0])} Python)"
+            assert compiled[1:] == python[1:], \
+                f"CRC errors / buffer size differ: compiled {compiled[1:]} vs Python {python[1:]}"
+
+    print("✅ Test 2 PASSED: Compiled scan matches the Python loop")
+    return True
+
+
+def run_all_tests():
+    """Run all test cases"""
+    print("=" * 60)
+    print("COMPILED RTCM KERNEL TEST SUITE")
+    print("=" * 60)
+
+    tests = [
+        test_crc24q_matches_reference,
+        test_compiled_scan_matches_python,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print("\n" + "=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Test suite for the NTRIP client
+Runs against a local fake caster - no network or GPS hardware needed:
+1. Reception loop retries after a failed reconnect
+2. Statistics serialise to JSON
+3. Fallback GGA stays quiet while the caller uploads
+"""
+
+import json
+import random
+import sys
+import socket
+import struct
+import threading
+import time
+
+from gps.test_support import rtcm_frame
+
+
+class FakeCaster:
+    """Accepts NTRIP connections and answers each with ICY 200 OK and one RTCM frame"""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.connections = 0
+        self._server = socket.socket()
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen(4)
+        self.port = self._server.getsockname()[1]
+        self._open = []
+        self.uploads = bytearray()  # Everything clients sent after their request
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while self.frames:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            conn.recv(4096)
+            conn.sendall(b'ICY 200 OK\r\n\r\n' + self.frames.pop(0))
+            self._open.append(conn)
+            threading.Thread(target=self._record, args=(conn,), daemon=True).start()
+
+    def _record(self, conn):
+        while True:
+            try:
+                data = conn.recv(4096)
+            except OSError:
+                return
+            if not data:
+                return
+            self.uploads += data
+
+    def gga_sentences(self):
+        return [line for line in bytes(self.uploads).split(b'\r\n') if line.startswith(b'$')]
+
+    def reset_last(self):
+        """Drop the newest connection with a TCP RST so the client's recv fails"""
+        conn = self._open.pop()
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        conn.close()
+
+    def close(self):
+        for conn in self._open:
+            conn.close()
+        self._server.close()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_retry_after_failed_reconnect():
+    """A failed reconnect must not leave the reception loop waiting on nothing"""
+    print("\n=== Test 1: Retry After Failed Reconnect ===")
+
+    from gps import ntrip_client
+    from gps.ntrip_client import NTRIPClient
+
+    caster = FakeCaster([rtcm_frame(1005), rtcm_frame(1006)])
+    saved_interval = ntrip_client.NTRIP_RECONNECT_INTERVAL
+    ntrip_client.NTRIP_RECONNECT_INTERVAL = 0.01  # Keep the backoff short
+
+    class FlakyReconnectClient(NTRIPClient):
+        # NTRIPClient has __slots__, so override in a subclass rather than patch the instance
+        __slots__ = ('reconnects',)
+
+        def _reconnect(self):
+            self.reconnects.append(time.monotonic())
+            if len(self.reconnects) == 1:
+                # Same end state as a caster that refused us: socket gone, not connected
+                self._cleanup_socket()
+                return False
+            return super()._reconnect()
+
+    client = FlakyReconnectClient({'caster': '127.0.0.1', 'port': caster.port,
+                                   'mountpoint': 'TEST', 'username': 'user', 'password': 'pass'})
+    client.reconnects = reconnects = []
+    received = []
+    try:
+        assert client.connect(), "initial connect failed"
+        assert client.start_data_reception(lambda data: received.append(bytes(data)))
+        assert wait_for(lambda: len(received) == 1), "first frame not received"
+
+        caster.reset_last()
+        assert wait_for(lambda: len(received) == 2), \
+            f"no data after failed reconnect ({len(reconnects)} reconnect attempt(s))"
+
+        types = [(frame[3] << 4) | (frame[4] >> 4) for frame in received]
+        print(f"  Reconnect attempts: {len(reconnects)}, frames: {types}")
+        assert len(reconnects) == 2, f"expected 2 reconnect attempts, got {len(reconnects)}"
+        assert types == [1005, 1006], f"unexpected frames {types}"
+        assert client.is_connected()
+    finally:
+        client.disconnect()
+        caster.close()
+        ntrip_client.NTRIP_RECONNECT_INTERVAL = saved_interval
+
+    print("✅ Test 1 PASSED: Reception loop recovered on the second reconnect")
+    return True
+
+
+def test_statistics_json():
+    """get_statistics() is exported as JSON, config section included"""
+    print("\n=== Test 2: Statistics JSON ===")
+
+    from gps.ntrip_client import NTRIPClient
+
+    client = NTRIPClient({'caster': 'caster.example', 'port': 2101,
+                          'mountpoint': 'TEST', 'username': 'user', 'password': 'pass'})
+    stats = json.loads(json.dumps(client.get_statistics()))
+    print(f"  Config: {stats['config']}")
+    assert stats['config'] == {'caster': 'caster.example', 'port': 2101, 'mountpoint': 'TEST',
+                               'username': 'use***', 'ssl': False}
+
+    # Callers get their own copy - editing it must not leak into the next report
+    client.get_statistics()['config']['caster'] = 'changed'
+    assert client.get_statistics()['config']['caster'] == 'caster.example'
+
+    print("✅ Test 2 PASSED: Statistics are JSON serialisable")
+    return True
+
+
+def test_no_fallback_gga_while_caller_uploads():
+    """A caller uploading on its own jittery cadence must not get dummy GGAs interleaved"""
+    print("\n=== Test 3: No Fallback GGA While Caller Uploads ===")
+
+    from gps import ntrip_client
+    from gps.ntrip_client import NTRIPClient
+
+    interval = 0.1  # Scaled-down 1 s cadence to keep the test short
+    saved_interval = ntrip_client.NTRIP_GGA_INTERVAL
+    ntrip_client.NTRIP_GGA_INTERVAL = interval
+
+    caster = FakeCaster([rtcm_frame(1005)])
+    client = NTRIPClient({'caster': '127.0.0.1', 'port': caster.port,
+                          'mountpoint': 'TEST', 'username': 'user', 'password': 'pass'})
+    real_gga = b'$GNGGA,120000,5207.4074,N,02130.0000,E,1,12,0.8,100.0,M,0.0,M,,*00\r\n'
+    rng = random.Random(7)
+    try:
+        assert client.connect(), "initial connect failed"
+        assert client.start_data_reception(lambda data: None)
+
+        # Like RTKSystem: first upload right after connecting, then a 1 s deadline
+        # checked on a 100 ms poll, so each upload lands up to one poll late
+        for _ in range(30):
+            assert client.send_gga(real_gga)
+            time.sleep(interval + rng.uniform(0, interval / 10) + 0.002)
+        sentences = caster.gga_sentences()
+        # The initial GGA at connect is the dummy - nothing else may be
+        dummies = [line for line in sentences[1:] if b'5207.4074' not in line]
+        print(f"  GGA sentences: {len(sentences)}, fallback after connect: {len(dummies)}")
+        assert not dummies, f"fallback GGA sent while the caller was uploading: {dummies[:2]}"
+        assert len(sentences) == 31, f"expected 31 GGA sentences, got {len(sentences)}"
+
+        # Once the caller goes quiet the fallback takes over again
+        assert wait_for(lambda: len(caster.gga_sentences()) > 31, timeout=5 * interval), \
+            "no fallback GGA after the caller went silent"
+    finally:
+        client.disconnect()
+        caster.close()
+        ntrip_client.NTRIP_GGA_INTERVAL = saved_interval
+
+    print("✅ Test 3 PASSED: Only the caller's GGA reached the caster")
+    return True
+
+
+def run_all_tests():
+    """Run all test cases"""
+    print("=" * 60)
+    print("NTRIP CLIENT TEST SUITE")
+    print("=" * 60)
+
+    tests = [
+        test_retry_after_failed_reconnect,
+        test_statistics_json,
+        test_no_fallback_gga_while_caller_uploads,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print("\n" + "=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
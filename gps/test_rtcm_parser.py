@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test suite for the RTCM 3 parser
+Tests:
+1. Single-frame fast path resyncs after a CRC failure
+2. A full receive buffer behind a partial frame is parsed completely
+3. Statistics are returned as independent copies
+"""
+
+import sys
+
+from gps.test_support import rtcm_frame
+
+
+def test_fast_path_resync():
+    """A chunk that looks like one frame but fails its CRC is searched again one byte on"""
+    print("\n=== Test 1: Fast Path Resync ===")
+
+    from gps.rtcm_parser import RTCMParser
+
+    inner = rtcm_frame(1005)
+    # Outer header claims a frame that ends exactly where the chunk ends, so the
+    # whole chunk takes the single-frame path - but its "CRC" is the inner frame's
+    chunk = bytes([0xD3, 0x00, len(inner) - 3]) + inner
+    assert 6 + chunk[2] == len(chunk)
+
+    parser = RTCMParser()
+    messages = parser.add_data(chunk)
+    types = [message.message_type for message in messages]
+    stats = parser.get_statistics()
+    print(f"  Parsed: {types}, CRC errors: {stats['crc_errors']}")
+
+    assert types == [1005], f"inner frame lost, got {types}"
+    assert messages[0].raw_message == inner
+    assert stats['crc_errors'] == 1, f"expected 1 CRC error, got {stats['crc_errors']}"
+    assert stats['buffer_size'] == 0
+
+    # A good single frame still takes the fast path and leaves nothing buffered
+    messages = parser.add_data(memoryview(rtcm_frame(1077, 100)))
+    assert [message.message_type for message in messages] == [1077]
+    assert parser.get_statistics()['buffer_size'] == 0
+
+    print("✅ Test 1 PASSED: Embedded frame recovered after fast-path CRC failure")
+    return True
+
+
+def test_full_recv_after_partial_frame():
+    """A 64 KiB chunk following a partial frame must not trip the buffer cap"""
+    print("\n=== Test 2: Full Receive After Partial Frame ===")
+
+    from gps.rtcm_parser import RTCMParser, RTCM_MAX_BUFFER_SIZE
+
+    first = rtcm_frame(1077, 500)
+    frames = []
+    size = len(first) - 100
+    while size < RTCM_MAX_BUFFER_SIZE:
+        frame = rtcm_frame(1087, 400)
+        frames.append(frame)
+        size += len(frame)
+    # Rest of the first frame plus complete frames - the size of one full recv
+    stream = first + b''.join(frames)
+    head, chunk = stream[:100], stream[100:100 + RTCM_MAX_BUFFER_SIZE]
+    complete = 1 + (len(chunk) - (len(first) - 100)) // len(frames[0])
+
+    parser = RTCMParser()
+    assert parser.add_data(head) == []
+    messages = parser.add_data(chunk)
+    stats = parser.get_statistics()
+    print(f"  Parsed {len(messages)} of {complete} complete frames, "
+          f"{stats['buffer_size']} bytes left over")
+
+    assert len(messages) == complete, f"expected {complete} frames, got {len(messages)}"
+    assert messages[0].raw_message == first
+    assert stats['crc_errors'] == 0
+    assert stats['buffer_size'] == len(stream[:100 + RTCM_MAX_BUFFER_SIZE]) - \
+        (len(first) + (complete - 1) * len(frames[0]))
+
+    print("✅ Test 2 PASSED: No complete frame dropped by the buffer cap")
+    return True
+
+
+def test_statistics_copies():
+    """Editing one caller's statistics must not show up for the next caller"""
+    print("\n=== Test 3: Statistics Copies ===")
+
+    from gps.rtcm_parser import RTCMParser
+
+    parser = RTCMParser()
+    parser.add_data(rtcm_frame(1005))
+    stats = parser.get_statistics()
+    stats['extra'] = True
+    stats['message_types'][9999] = 1
+
+    fresh = parser.get_statistics()
+    print(f"  Fresh statistics: {fresh}")
+    assert 'extra' not in fresh
+    assert fresh['message_types'] == {1005: 1}
+
+    print("✅ Test 3 PASSED: Cached statistics are not shared")
+    return True
+
+
+def run_all_tests():
+    """Run all test cases"""
+    print("=" * 60)
+    print("RTCM PARSER TEST SUITE")
+    print("=" * 60)
+
+    tests = [
+        test_fast_path_resync,
+        test_full_recv_after_partial_frame,
+        test_statistics_copies,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print("\n" + "=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
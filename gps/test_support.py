@@ -0,0 +1,32 @@
+"""
+Shared helpers for the gps test suites
+"""
+
+import sys
+
+
+def crc24q(data):
+    """Bit-by-bit CRC-24Q - the reference the table and compiled kernels are checked against"""
+    crc = 0
+    for byte in data:
+        crc ^= byte << 16
+        for _ in range(8):
+            crc <<= 1
+            if crc & 0x1000000:
+                crc ^= 0x1864CFB
+    return crc & 0xFFFFFF
+
+
+def rtcm_frame(msg_type, payload_len=20):
+    body = bytes([(msg_type >> 4) & 0xFF, (msg_type & 0xF) << 4]) + bytes(payload_len - 2)
+    frame = bytes([0xD3, (payload_len >> 8) & 0x03, payload_len & 0xFF]) + body
+    return frame + crc24q(frame).to_bytes(3, 'big')
+
+
+def skip_test(reason):
+    """Skip under pytest; under the plain runners report it and count the test as passed"""
+    if 'pytest' in sys.modules:
+        import pytest
+        pytest.skip(reason)
+    print(f"⏭️  Skipped: {reason}")
+    return True